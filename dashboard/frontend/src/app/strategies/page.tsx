@@ -163,7 +163,17 @@ export default function StrategiesPage() {
     useEffect(() => {
         setDataLoaded(false);
         fetch("/strat_01_trades.json").then(r => r.json()).then(d => {
-            setTradeData(d[exitMode] || []); setEquityData(d[`${exitMode}_equity`] || []); setDataLoaded(true);
+            setTradeData(d[exitMode] || []);
+            // Equity arrives as four parallel arrays (one JSON key per
+            // series instead of per day); zip back into chart points.
+            const eq = d[`${exitMode}_equity`];
+            const points: EquityPoint[] = eq?.dates
+                ? eq.dates.map((date: string, i: number) => ({
+                    date, daily_pnl: eq.daily_pnl[i], cumulative: eq.cumulative[i], drawdown: eq.drawdown[i],
+                }))
+                : (eq || []);
+            setEquityData(points);
+            setDataLoaded(true);
         }).catch(() => setDataLoaded(true));
     }, [exitMode]);
 
@@ -13,6 +13,8 @@ from typing import Optional
 
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 
 from core.config import get_settings, CANDLES_DIR, DB_PATH
@@ -163,6 +165,21 @@ class DataStorage:
             "oi": c.oi,
         } for c in candles])
 
+        return self._write_candle_frame(df, instrument, interval)
+
+    def save_candles_df(self, df: pd.DataFrame, instrument: Instrument, interval: Interval) -> Path:
+        """
+        Save an OHLCV DataFrame directly (bulk path).
+
+        Skips the per-row Candle model construction of save_candles — callers
+        that already hold a columnar frame (data fetchers, synthetic
+        generators) hand it over as-is.
+        """
+        if df.empty:
+            return Path()
+        return self._write_candle_frame(df.copy(), instrument, interval)
+
+    def _write_candle_frame(self, df: pd.DataFrame, instrument: Instrument, interval: Interval) -> Path:
         df["timestamp"] = pd.to_datetime(df["timestamp"])
         df = df.sort_values("timestamp").drop_duplicates(subset=["timestamp"])
 
@@ -200,13 +217,21 @@ class DataStorage:
             logger.warning("No data file found: %s", path)
             return pd.DataFrame()
 
-        df = pd.read_parquet(path)
-        df["timestamp"] = pd.to_datetime(df["timestamp"])
-
+        # Push the date filter and column projection into the Parquet scan:
+        # row groups outside [from_dt, to_dt] are skipped via their
+        # min/max statistics instead of being decoded and dropped in pandas
+        dataset = ds.dataset(path, format="parquet")
+        predicate = None
         if from_dt:
-            df = df[df["timestamp"] >= pd.Timestamp(from_dt)]
+            predicate = pc.field("timestamp") >= pd.Timestamp(from_dt)
         if to_dt:
-            df = df[df["timestamp"] <= pd.Timestamp(to_dt)]
+            expr = pc.field("timestamp") <= pd.Timestamp(to_dt)
+            predicate = expr if predicate is None else predicate & expr
+
+        columns = [c for c in ("timestamp", "open", "high", "low", "close", "volume", "oi")
+                   if c in dataset.schema.names]
+        df = dataset.to_table(filter=predicate, columns=columns).to_pandas()
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
 
         return df.sort_values("timestamp").reset_index(drop=True)
 
@@ -245,13 +245,19 @@ class Backtester:
     ) -> list[tuple]:
         """Build a chronologically sorted sequence of (timestamp, instrument, row)."""
         sequence = []
+        columns = ["timestamp", "open", "high", "low", "close", "volume", "oi"]
 
         for inst in instruments:
             key = f"{inst.display_name}_{interval.value}"
             if key not in data_store:
                 continue
             df = data_store[key]
-            for _, row in df.iterrows():
+            # itertuples skips the per-row Series boxing of iterrows
+            # (~5-10x faster); plain dicts keep the ["open"]/.get access
+            # the main loop relies on
+            present = [c for c in columns if c in df.columns]
+            for values in df[present].itertuples(index=False, name=None):
+                row = dict(zip(present, values))
                 sequence.append((row["timestamp"], inst, row))
 
         sequence.sort(key=lambda x: x[0])
@@ -140,6 +140,46 @@ class CostModel:
             quantity: Total quantity
             num_legs: Number of legs in the strategy
         """
+        rates = self._rates_for(trade_date)
+        return self._calculate_with_rates(rates, action, premium, exit_premium, quantity, num_legs)
+
+    def calculate_batch(
+        self,
+        trade_date: date,
+        actions: list[str],
+        premiums: list[float],
+        exit_premiums: list[float],
+        quantities: list[int],
+    ) -> list[TradeCost]:
+        """
+        Calculate costs for many single-leg trades closed at the same instant
+        (e.g. close_all on a straddle). Equivalent to calling calculate() per
+        leg, but the tax-rate lookup is shared across the batch.
+        """
+        rates = self._rates_for(trade_date)
+        return [
+            self._calculate_with_rates(rates, action, premium, exit_premium, quantity, 1)
+            for action, premium, exit_premium, quantity
+            in zip(actions, premiums, exit_premiums, quantities)
+        ]
+
+    def _rates_for(self, trade_date: date) -> Optional[dict]:
+        """Applicable tax rates for a trade date (None when taxes are off)."""
+        if not self.config.use_taxes:
+            return None
+        return (self.config.custom_tax_rates
+                if self.config.custom_tax_rates
+                else get_tax_rates(trade_date))
+
+    def _calculate_with_rates(
+        self,
+        rates: Optional[dict],
+        action: str,
+        premium: float,
+        exit_premium: float,
+        quantity: int,
+        num_legs: int,
+    ) -> TradeCost:
         cost = TradeCost()
 
         # 1. Slippage (both entry and exit, per leg)
@@ -149,14 +189,9 @@ class CostModel:
         num_orders = num_legs * 2  # entry + exit
         cost.brokerage = self.config.brokerage_per_order * num_orders
 
-        if not self.config.use_taxes:
+        if rates is None:
             return cost
 
-        # Get applicable tax rates
-        rates = (self.config.custom_tax_rates
-                 if self.config.custom_tax_rates
-                 else get_tax_rates(trade_date))
-
         # Turnover for charges
         entry_turnover = premium * quantity * num_legs
         exit_turnover = exit_premium * quantity * num_legs
@@ -590,7 +590,11 @@ def execute_leg(
     else:
         target_price = None
 
-    # Walk through candles after entry to find exit
+    # Scan candles after entry to find exit — fused kernel (Fix #2 — Speed).
+    # All trigger masks are built in one vectorized pass over the day's arrays;
+    # the winning exit is the reason with the earliest hit index. Ties at the
+    # same candle resolve by stack order: time exit > SL > target, matching
+    # the original per-candle branch order.
     entry_ts = entry_row["timestamp"]
     post_entry = strike_data[strike_data["timestamp"] > entry_ts]
 
@@ -598,69 +602,61 @@ def execute_leg(
     exit_time = config.exit_time
     exit_reason = "time_exit"
 
-    for _, candle in post_entry.iterrows():
-        candle_time = candle["timestamp"]
+    n = len(post_entry)
+    if n > 0:
+        timestamps = post_entry["timestamp"]
+        opens = post_entry["open"].to_numpy()
+        highs = post_entry["high"].to_numpy()
+        lows = post_entry["low"].to_numpy()
+        closes = post_entry["close"].to_numpy()
 
-        # Time exit check
-        if candle_time.hour > exit_h or (candle_time.hour == exit_h and candle_time.minute >= exit_m):
-            exit_price = candle["open"]  # Rule B: exit at OPEN of exit candle
-            exit_time = candle_time.strftime("%H:%M")
-            exit_reason = "time_exit"
-            break
+        time_mask = (timestamps.dt.hour > exit_h) | \
+                    ((timestamps.dt.hour == exit_h) & (timestamps.dt.minute >= exit_m))
+        time_mask = time_mask.to_numpy()
+
+        false_mask = np.zeros(n, dtype=bool)
+        sl_hard_mask = sl_close_mask = tgt_hard_mask = tgt_close_mask = false_mask
 
-        # SL check
         if sl_price is not None:
+            # SELL: SL triggers when price goes UP; BUY: when price goes DOWN
             if leg.action == "SELL":
-                # For SELL: SL triggers when price goes UP
-                if sl_type == "hard" and candle["high"] >= sl_price:
-                    exit_price = sl_price  # Hard SL: exit at SL price exactly
-                    exit_time = candle_time.strftime("%H:%M")
-                    exit_reason = "sl_hard"
-                    break
-                elif sl_type == "close" and candle["close"] >= sl_price:
-                    exit_price = candle["close"]  # Close SL: exit at candle close
-                    exit_time = candle_time.strftime("%H:%M")
-                    exit_reason = "sl_close"
-                    break
+                breached = highs >= sl_price if sl_type == "hard" else closes >= sl_price
             else:
-                # For BUY: SL triggers when price goes DOWN
-                if sl_type == "hard" and candle["low"] <= sl_price:
-                    exit_price = sl_price
-                    exit_time = candle_time.strftime("%H:%M")
-                    exit_reason = "sl_hard"
-                    break
-                elif sl_type == "close" and candle["close"] <= sl_price:
-                    exit_price = candle["close"]
-                    exit_time = candle_time.strftime("%H:%M")
-                    exit_reason = "sl_close"
-                    break
+                breached = lows <= sl_price if sl_type == "hard" else closes <= sl_price
+            if sl_type == "hard":
+                sl_hard_mask = breached
+            else:
+                sl_close_mask = breached
 
-        # Target check
         if target_price is not None:
+            # SELL: target when price goes DOWN; BUY: when price goes UP
             if leg.action == "SELL":
-                # For SELL: target when price goes DOWN
-                if target_type == "hard" and candle["low"] <= target_price:
-                    exit_price = target_price
-                    exit_time = candle_time.strftime("%H:%M")
-                    exit_reason = "target_hard"
-                    break
-                elif target_type == "close" and candle["close"] <= target_price:
-                    exit_price = candle["close"]
-                    exit_time = candle_time.strftime("%H:%M")
-                    exit_reason = "target_close"
-                    break
+                breached = lows <= target_price if target_type == "hard" else closes <= target_price
             else:
-                # For BUY: target when price goes UP
-                if target_type == "hard" and candle["high"] >= target_price:
-                    exit_price = target_price
-                    exit_time = candle_time.strftime("%H:%M")
-                    exit_reason = "target_hard"
-                    break
-                elif target_type == "close" and candle["close"] >= target_price:
-                    exit_price = candle["close"]
-                    exit_time = candle_time.strftime("%H:%M")
-                    exit_reason = "target_close"
-                    break
+                breached = highs >= target_price if target_type == "hard" else closes >= target_price
+            if target_type == "hard":
+                tgt_hard_mask = breached
+            else:
+                tgt_close_mask = breached
+
+        masks = np.stack([time_mask, sl_hard_mask, sl_close_mask, tgt_hard_mask, tgt_close_mask])
+        has_hit = masks.any(axis=1)
+
+        if has_hit.any():
+            first_hit = np.where(has_hit, masks.argmax(axis=1), n)
+            reason_idx = int(first_hit.argmin())  # first occurrence wins ties
+            hit_idx = int(first_hit[reason_idx])
+
+            exit_reason = ("time_exit", "sl_hard", "sl_close", "target_hard", "target_close")[reason_idx]
+            if exit_reason == "time_exit":
+                exit_price = opens[hit_idx]  # Rule B: exit at OPEN of exit candle
+            elif exit_reason == "sl_hard":
+                exit_price = sl_price  # Hard SL: exit at SL price exactly
+            elif exit_reason == "target_hard":
+                exit_price = target_price
+            else:
+                exit_price = closes[hit_idx]  # Close SL/target: exit at candle close
+            exit_time = timestamps.iloc[hit_idx].strftime("%H:%M")
 
     # Calculate P&L
     quantity = leg.lots * config.lot_size
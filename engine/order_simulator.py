@@ -37,6 +37,7 @@ class OrderSimulator:
         commission: float = 20.0,           # ₹ per order
     ):
         self._slippage_pct = slippage_pct / 100
+        self._slippage_pct_display = slippage_pct
         self._commission = commission
 
     def process_orders(self, orders: list[Order], candle: Candle) -> list[Order]:
@@ -74,12 +75,13 @@ class OrderSimulator:
 
                 filled.append(order)
 
-                logger.debug(
-                    "FILL: %s %s %s x%d @ ₹%.2f (slippage: %.2f%%)",
-                    order.side.value, order.instrument.display_name,
-                    order.order_type.value, order.quantity,
-                    fill_price, self._slippage_pct * 100,
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "FILL: %s %s %s x%d @ ₹%.2f (slippage: %.2f%%)",
+                        order.side.value, order.instrument.display_name,
+                        order.order_type.value, order.quantity,
+                        fill_price, self._slippage_pct_display,
+                    )
 
         return filled
 
@@ -74,13 +74,20 @@ class Portfolio:
         if pos is None or not pos.is_open:
             # New position
             qty = order.quantity if order.side == OrderSide.BUY else -order.quantity
-            self.positions[key] = Position(
-                instrument=order.instrument,
-                quantity=qty,
-                avg_price=order.avg_fill_price,
-                ltp=order.avg_fill_price,
-                strategy_id=order.strategy_id,
-            )
+            if pos is None:
+                self.positions[key] = Position(
+                    instrument=order.instrument,
+                    quantity=qty,
+                    avg_price=order.avg_fill_price,
+                    ltp=order.avg_fill_price,
+                    strategy_id=order.strategy_id,
+                )
+            else:
+                # Reuse the flat Position instead of allocating a fresh one
+                pos.quantity = qty
+                pos.avg_price = order.avg_fill_price
+                pos.ltp = order.avg_fill_price
+                pos.strategy_id = order.strategy_id
             self._entry_orders[key] = order
 
             # Update cash
@@ -93,16 +100,11 @@ class Portfolio:
             new_qty = old_qty + fill_qty
 
             if (old_qty > 0 and fill_qty > 0) or (old_qty < 0 and fill_qty < 0):
-                # Adding to position — update average price
+                # Adding to position — update average price in place
                 total_cost = (pos.avg_price * abs(old_qty)) + (order.avg_fill_price * abs(fill_qty))
-                new_avg = total_cost / abs(new_qty)
-                self.positions[key] = Position(
-                    instrument=order.instrument,
-                    quantity=new_qty,
-                    avg_price=new_avg,
-                    ltp=order.avg_fill_price,
-                    strategy_id=order.strategy_id,
-                )
+                pos.quantity = new_qty
+                pos.avg_price = total_cost / abs(new_qty)
+                pos.ltp = order.avg_fill_price
             else:
                 # Closing (fully or partially)
                 closed_qty = min(abs(old_qty), abs(fill_qty))
@@ -133,25 +135,18 @@ class Portfolio:
                 )
                 self.trades.append(trade)
 
-                # Update or close position
+                # Update or close position — mutate in place
                 if new_qty == 0:
-                    self.positions[key] = Position(
-                        instrument=order.instrument,
-                        quantity=0,
-                        avg_price=0.0,
-                        strategy_id=order.strategy_id,
-                    )
+                    pos.quantity = 0
+                    pos.avg_price = 0.0
+                    pos.ltp = 0.0
                     if key in self._entry_orders:
                         del self._entry_orders[key]
                 else:
                     # Partial close — remaining position continues
-                    self.positions[key] = Position(
-                        instrument=order.instrument,
-                        quantity=new_qty,
-                        avg_price=pos.avg_price if abs(new_qty) < abs(old_qty) else order.avg_fill_price,
-                        ltp=order.avg_fill_price,
-                        strategy_id=order.strategy_id,
-                    )
+                    pos.quantity = new_qty
+                    pos.avg_price = pos.avg_price if abs(new_qty) < abs(old_qty) else order.avg_fill_price
+                    pos.ltp = order.avg_fill_price
                     if (old_qty > 0 and new_qty < 0) or (old_qty < 0 and new_qty > 0):
                         # Reversed position — new entry
                         self._entry_orders[key] = order
@@ -170,14 +165,6 @@ class Portfolio:
 
     def update_ltp(self, instrument: Instrument, ltp: float) -> None:
         """Update last traded price for MTM calculation."""
-        key = instrument.display_name
-        if key in self.positions:
-            pos = self.positions[key]
-            self.positions[key] = Position(
-                instrument=pos.instrument,
-                quantity=pos.quantity,
-                avg_price=pos.avg_price,
-                ltp=ltp,
-                pnl=pos.pnl,
-                strategy_id=pos.strategy_id,
-            )
+        pos = self.positions.get(instrument.display_name)
+        if pos is not None:
+            pos.ltp = ltp
@@ -6,8 +6,9 @@ Pre-trade and runtime risk checks to protect capital.
 from __future__ import annotations
 
 import logging
-from datetime import datetime, time
-from typing import Optional
+from collections import defaultdict
+from datetime import date, datetime, time
+from typing import Callable, Optional
 
 from core.config import get_settings
 from core.exceptions import (
@@ -39,6 +40,7 @@ class RiskManager:
         max_position_value: Optional[float] = None,
         max_open_positions: Optional[int] = None,
         circuit_breaker_pct: Optional[float] = None,
+        clock: Optional[Callable[[], date]] = None,
     ):
         settings = get_settings()
         risk_cfg = settings.risk
@@ -50,11 +52,20 @@ class RiskManager:
         self._max_open_positions = max_open_positions or risk_cfg.max_open_positions
         self._circuit_breaker_pct = circuit_breaker_pct or risk_cfg.circuit_breaker_drawdown_pct
 
+        # Square-off times are session-invariant — parse them once instead of
+        # calling get_settings() + strptime on every tick
+        self._sq_nse = datetime.strptime(risk_cfg.auto_square_off_nse, "%H:%M").time()
+        self._sq_mcx = datetime.strptime(risk_cfg.auto_square_off_mcx, "%H:%M").time()
+
+        # Session clock — injectable so backtests can supply the simulated
+        # date instead of hitting the wall clock per order
+        self._clock = clock or date.today
+
         # State
         self._daily_pnl: float = 0.0
-        self._strategy_pnl: dict[str, float] = {}
+        self._strategy_pnl: defaultdict[str, float] = defaultdict(float)
         self._circuit_breaker_active = False
-        self._today: Optional[str] = None
+        self._today_ord: int = -1
 
     def pre_trade_check(
         self,
@@ -66,31 +77,45 @@ class RiskManager:
         Run all pre-trade validations.
         Raises RiskViolation subclass if any check fails.
         """
-        # Reset daily tracking if new day
-        today = datetime.now().strftime("%Y-%m-%d")
-        if self._today != today:
-            self._today = today
+        # Reset daily tracking if new day — cached int ordinal compare
+        today_ord = self._clock().toordinal()
+        if self._today_ord != today_ord:
+            self._today_ord = today_ord
             self._daily_pnl = 0.0
 
         self._daily_pnl = daily_pnl
 
+        # Checks ordered cheapest-first so the common "risk passes" path does
+        # minimal work: flag check, then plain arithmetic, and the O(N)
+        # position scan last (and only for BUY orders, where it can trip).
+        abs_daily_loss = abs(self._daily_pnl)
+
         # 1. Circuit breaker
         if self._circuit_breaker_active:
             raise CircuitBreakerTriggered(
                 "circuit_breaker",
-                f"Circuit breaker active. Daily loss: ₹{abs(self._daily_pnl):,.2f}"
+                f"Circuit breaker active. Daily loss: ₹{abs_daily_loss:,.2f}"
             )
 
         # 2. Max daily loss
-        if abs(self._daily_pnl) >= self._max_loss_day:
+        if abs_daily_loss >= self._max_loss_day:
             self._circuit_breaker_active = True
             raise MaxLossBreached(
                 "max_daily_loss",
-                f"Daily loss ₹{abs(self._daily_pnl):,.2f} exceeds limit ₹{self._max_loss_day:,.2f}"
+                f"Daily loss ₹{abs_daily_loss:,.2f} exceeds limit ₹{self._max_loss_day:,.2f}"
             )
 
-        # 3. Max strategy loss
-        strategy_pnl = self._strategy_pnl.get(order.strategy_id, 0.0)
+        # 3. Circuit breaker on drawdown
+        drawdown_pct = (abs_daily_loss / self._initial_capital) * 100
+        if drawdown_pct >= self._circuit_breaker_pct:
+            self._circuit_breaker_active = True
+            raise CircuitBreakerTriggered(
+                "drawdown_circuit_breaker",
+                f"Drawdown {drawdown_pct:.2f}% exceeds circuit breaker {self._circuit_breaker_pct:.2f}%"
+            )
+
+        # 4. Max strategy loss
+        strategy_pnl = self._strategy_pnl[order.strategy_id]
         if abs(strategy_pnl) >= self._max_loss_strategy:
             raise MaxLossBreached(
                 "max_strategy_loss",
@@ -98,14 +123,6 @@ class RiskManager:
                 f"exceeds limit ₹{self._max_loss_strategy:,.2f}"
             )
 
-        # 4. Max open positions
-        open_count = sum(1 for p in current_positions.values() if p.is_open)
-        if open_count >= self._max_open_positions and order.side == OrderSide.BUY:
-            raise PositionLimitBreached(
-                "max_positions",
-                f"Open positions ({open_count}) at limit ({self._max_open_positions})"
-            )
-
         # 5. Max position value
         order_value = order.quantity * (order.price or order.trigger_price or 0)
         if order_value > self._max_position_value:
@@ -114,42 +131,39 @@ class RiskManager:
                 f"Order value ₹{order_value:,.2f} exceeds limit ₹{self._max_position_value:,.2f}"
             )
 
-        # 6. Circuit breaker on drawdown
-        drawdown_pct = (abs(self._daily_pnl) / self._initial_capital) * 100
-        if drawdown_pct >= self._circuit_breaker_pct:
-            self._circuit_breaker_active = True
-            raise CircuitBreakerTriggered(
-                "drawdown_circuit_breaker",
-                f"Drawdown {drawdown_pct:.2f}% exceeds circuit breaker {self._circuit_breaker_pct:.2f}%"
-            )
+        # 6. Max open positions — only a BUY can breach, so skip the scan otherwise
+        if order.side == OrderSide.BUY:
+            open_count = sum(1 for p in current_positions.values() if p.is_open)
+            if open_count >= self._max_open_positions:
+                raise PositionLimitBreached(
+                    "max_positions",
+                    f"Open positions ({open_count}) at limit ({self._max_open_positions})"
+                )
 
         logger.debug("Risk check passed for %s %s x%d", order.side.value, order.instrument.display_name, order.quantity)
 
     def update_pnl(self, strategy_id: str, pnl: float) -> None:
         """Update P&L tracking after a trade."""
         self._daily_pnl += pnl
-        self._strategy_pnl[strategy_id] = self._strategy_pnl.get(strategy_id, 0.0) + pnl
+        self._strategy_pnl[strategy_id] += pnl
 
     def should_square_off(self, exchange: Exchange) -> bool:
         """Check if it's past the auto square-off time."""
-        settings = get_settings()
-        now = datetime.now().time()
-
         if exchange in (Exchange.NSE, Exchange.NFO, Exchange.BSE, Exchange.BFO):
-            sq_time = datetime.strptime(settings.risk.auto_square_off_nse, "%H:%M").time()
+            sq_time = self._sq_nse
         elif exchange == Exchange.MCX:
-            sq_time = datetime.strptime(settings.risk.auto_square_off_mcx, "%H:%M").time()
+            sq_time = self._sq_mcx
         else:
             return False
 
-        return now >= sq_time
+        return datetime.now().time() >= sq_time
 
     def reset_daily(self) -> None:
         """Reset daily tracking (call at start of each trading day)."""
         self._daily_pnl = 0.0
         self._strategy_pnl.clear()
         self._circuit_breaker_active = False
-        self._today = datetime.now().strftime("%Y-%m-%d")
+        self._today_ord = self._clock().toordinal()
         logger.info("Daily risk counters reset")
 
     @property
@@ -10,8 +10,11 @@ from __future__ import annotations
 
 import logging
 import math
+from bisect import bisect_left
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import date, time, datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
 import pandas as pd
@@ -21,12 +24,66 @@ from engine.cost_model import CostModel, CostConfig, TradeCost
 
 logger = logging.getLogger("antigravity.strategy_sdk")
 
+# Shared empty frame returned for unknown strike/type lookups — avoids
+# allocating a new DataFrame per miss.
+_EMPTY_DF = pd.DataFrame()
+
+# Map SDK option-type spellings to the data files' CALL/PUT labels without
+# an .upper() call per lookup.
+_CE_PE_MAP = {"CE": "CALL", "PE": "PUT", "ce": "CALL", "pe": "PUT"}
+
+
+try:  # Optional: numba JIT-compiles the metric scans when installed
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _max_dd_nb(arr):
+        equity = 0.0
+        peak = 0.0
+        max_dd = 0.0
+        for x in arr:
+            equity += x
+            if equity > peak:
+                peak = equity
+            dd = peak - equity
+            if dd > max_dd:
+                max_dd = dd
+        return max_dd
+
+    @njit(cache=True)
+    def _max_consec_nb(arr, winning):
+        count = 0
+        best = 0
+        for x in arr:
+            hit = x > 0 if winning else x < 0
+            if hit:
+                count += 1
+                if count > best:
+                    best = count
+            else:
+                count = 0
+        return best
+else:
+    _max_dd_nb = None
+    _max_consec_nb = None
+
+
+@lru_cache(maxsize=512)
+def _parse_time_str(s: str) -> time:
+    """Parse 'HH:MM' (or 'HH MM') into a time object, memoized — strategies
+    pass the same handful of time strings thousands of times per run."""
+    parts = s.replace(":", " ").split()
+    return time(int(parts[0]), int(parts[1]))
+
 
 # =========================================================================
 # Data Types
 # =========================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """A single open or closed position."""
     id: int
@@ -48,6 +105,9 @@ class Position:
     net_pnl: float = 0.0
     # Live tracking
     current_price: float = 0.0
+    # Day-local int code for (strike, option_type) — set by open_position so
+    # per-minute lookups skip string normalization entirely
+    leg_code: int = -1
 
     @property
     def unrealized_pnl(self) -> float:
@@ -59,7 +119,7 @@ class Position:
             return (self.current_price - self.entry_price) * self.quantity
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeRecord:
     """A completed trade for results output."""
     trade_date: date
@@ -83,7 +143,7 @@ class TradeRecord:
     cost: Optional[TradeCost] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DayResult:
     """Result from one trading day."""
     trade_date: date
@@ -121,11 +181,87 @@ class StrategyContext:
         self._cost_model = cost_model
         self._entry_time_str = entry_time_str
         self._exit_time_str = exit_time_str
-
-        self._positions: list[Position] = []
+        self._entry_time = _parse_time_str(entry_time_str)
+        self._exit_time = _parse_time_str(exit_time_str)
+
+        # Positions indexed by id so close/get are O(1) dict lookups instead
+        # of linear scans; _open_ids tracks which are still open. Ids are
+        # monotonic, so sorting them recovers open order.
+        self._positions_by_id: dict[int, Position] = {}
+        self._open_ids: set[int] = set()
         self._closed_positions: list[Position] = []
         self._next_id = 1
-        self._logs: list[str] = []
+        # Ring buffer — AI code may log inside tight candle loops, so keep
+        # memory bounded for the day
+        self._logs: deque[str] = deque(maxlen=10_000)
+
+        # Pre-group candles by (strike_rel, type) once so get_candles is an
+        # O(1) dict lookup instead of a boolean mask over the whole day
+        # (Fix #1 — Speed). Each leg gets a small int code; the hot-path
+        # indexes below are keyed by that code (int hashing beats tuple-of-
+        # string hashing in the per-minute loops).
+        self._leg_code: dict[tuple[str, str], int] = {}
+        self._leg_index: dict[int, pd.DataFrame] = {}
+        if not day_data.empty:
+            for key, grp in day_data.groupby(["strike_rel", "type"], sort=False):
+                code = len(self._leg_code)
+                self._leg_code[key] = code
+                self._leg_index[code] = grp.sort_values("timestamp").reset_index(drop=True)
+
+        # Point-lookup price index: (leg_code, hour, minute) →
+        # (open, close, absolute_strike). Built in one pass so the per-minute
+        # hot paths (get_option_price_at, update_prices) are plain dict
+        # lookups with no pandas masking.
+        self._price_idx: dict[tuple[int, int, int], tuple[float, float, float]] = {}
+        # Per-leg constants used at EOD: open of the first candle at/after the
+        # exit hour (for force-close) and the leg's absolute strike — both
+        # filled during the single indexing pass below.
+        self._exit_open_price: dict[int, float] = {}
+        self._abs_strike: dict[int, float] = {}
+        # Spot is identical across strikes at a given minute, so a flat array
+        # indexed by minutes-since-midnight (0 = no data sentinel) makes
+        # get_spot_price_at a single array read.
+        self._spot_by_min = np.zeros(24 * 60, dtype=np.float64)
+        if not day_data.empty:
+            has_abs = "absolute_strike" in day_data.columns
+            strikes = day_data["strike_rel"].to_numpy()
+            types = day_data["type"].to_numpy()
+            hours = day_data["timestamp"].dt.hour.to_numpy()
+            minutes = day_data["timestamp"].dt.minute.to_numpy()
+            opens = day_data["open"].to_numpy(np.float64)
+            closes = day_data["close"].to_numpy(np.float64)
+            abs_strikes = day_data["absolute_strike"].to_numpy() if has_abs else np.zeros(len(day_data))
+
+            if "spot_price" in day_data.columns:
+                ts_min = hours * 60 + minutes
+                spots = day_data["spot_price"].to_numpy(np.float64)
+                # Reversed assignment so the first row of each minute wins
+                self._spot_by_min[ts_min[::-1]] = spots[::-1]
+
+            price_idx = self._price_idx
+            leg_code = self._leg_code
+            leg_minutes: dict[int, tuple[list[int], list[float]]] = {}
+            for s, ty, h, m, o, c, a in zip(strikes, types, hours, minutes, opens, closes, abs_strikes):
+                code = leg_code[(s, ty)]
+                key = (code, h, m)
+                if key not in price_idx:  # first candle of the minute wins
+                    price_idx[key] = (float(o), float(c), float(a))
+                lm = leg_minutes.get(code)
+                if lm is None:
+                    lm = ([], [])
+                    leg_minutes[code] = lm
+                    if has_abs:
+                        self._abs_strike[code] = float(a)
+                lm[0].append(h * 60 + m)
+                lm[1].append(float(o))
+
+            # First candle at/after the exit hour per leg, via bisect on the
+            # (already timestamp-sorted) minute lists — no pandas mask needed
+            threshold = int(exit_time_str.split(":")[0]) * 60
+            for code, (mins, leg_opens) in leg_minutes.items():
+                i = bisect_left(mins, threshold)
+                if i < len(mins):
+                    self._exit_open_price[code] = leg_opens[i]
 
         # Precompute spot and VIX from first available candle
         if not day_data.empty:
@@ -142,10 +278,16 @@ class StrategyContext:
         if isinstance(t, time):
             return t
         if isinstance(t, str):
-            parts = t.replace(":", " ").split()
-            return time(int(parts[0]), int(parts[1]))
+            return _parse_time_str(t)
         return t
 
+    def _code_for(self, strike: str, option_type: str) -> int:
+        """Translate (strike, 'CE'/'PE') to the day's int leg code (-1 = unknown)."""
+        leg_type = _CE_PE_MAP.get(option_type)
+        if leg_type is None:
+            leg_type = "CALL" if option_type.upper() == "CE" else "PUT"
+        return self._leg_code.get((strike, leg_type), -1)
+
     # ── Read-only properties ──
 
     @property
@@ -197,38 +339,25 @@ class StrategyContext:
             DataFrame with columns: timestamp, open, high, low, close, volume, oi,
                                      spot_price, absolute_strike
         """
-        if self._day_data.empty:
-            return pd.DataFrame()
+        # Cached view — callers only read, so no defensive copy needed
+        return self._leg_index.get(self._code_for(strike, option_type), _EMPTY_DF)
 
-        leg_type = "CALL" if option_type.upper() == "CE" else "PUT"
-        mask = (self._day_data["strike_rel"] == strike) & (self._day_data["type"] == leg_type)
-        df = self._day_data[mask].copy().sort_values("timestamp").reset_index(drop=True)
-        return df
+    def get_candles_by_code(self, code: int) -> pd.DataFrame:
+        """Get candles by int leg code (see Position.leg_code) — skips the
+        strike/option-type string normalization of get_candles."""
+        return self._leg_index.get(code, _EMPTY_DF)
 
     def get_spot_price_at(self, t) -> float:
         """Get spot price at a specific time of day. Accepts time object or 'HH:MM' string."""
         t = self._to_time(t)
-        if self._day_data.empty:
-            return 0.0
-        mask = (self._day_data["timestamp"].dt.hour == t.hour) & \
-               (self._day_data["timestamp"].dt.minute == t.minute)
-        rows = self._day_data[mask]
-        if rows.empty:
-            return self._spot
-        return float(rows.iloc[0].get("spot_price", self._spot))
+        v = self._spot_by_min[t.hour * 60 + t.minute]
+        return float(v) if v > 0 else self._spot
 
     def get_option_price_at(self, strike: str, option_type: str, t) -> float:
         """Get option open price at a specific time. Accepts time object or 'HH:MM' string."""
         t = self._to_time(t)
-        candles = self.get_candles(strike, option_type)
-        if candles.empty:
-            return 0.0
-        mask = (candles["timestamp"].dt.hour == t.hour) & \
-               (candles["timestamp"].dt.minute == t.minute)
-        rows = candles[mask]
-        if rows.empty:
-            return 0.0
-        return float(rows.iloc[0]["open"])
+        entry = self._price_idx.get((self._code_for(strike, option_type), t.hour, t.minute))
+        return entry[0] if entry is not None else 0.0
 
     def get_available_strikes(self) -> list[str]:
         """Get list of available relative strikes for the day."""
@@ -267,8 +396,7 @@ class StrategyContext:
             at_time = self._to_time(at_time)
         if price is None:
             if at_time is None:
-                h, m = map(int, self._entry_time_str.split(":"))
-                at_time = time(h, m)
+                at_time = self._entry_time
             price = self.get_option_price_at(strike, option_type, at_time)
 
         if price <= 0:
@@ -289,8 +417,10 @@ class StrategyContext:
             entry_time=f"{at_time.hour:02d}:{at_time.minute:02d}" if at_time else self._entry_time_str,
             label=label,
             current_price=price,
+            leg_code=self._code_for(strike, option_type),
         )
-        self._positions.append(pos)
+        self._positions_by_id[pid] = pos
+        self._open_ids.add(pid)
         return pid
 
     def close_position(self, position_id: int, price: Optional[float] = None,
@@ -307,35 +437,44 @@ class StrategyContext:
         Returns:
             True if position was found and closed
         """
-        for pos in self._positions:
-            if pos.id == position_id and pos.is_open:
-                exit_price = price if price is not None else pos.current_price
-                pos.exit_price = exit_price
-                pos.exit_time = at_time or ""
-                pos.exit_reason = reason
-                pos.is_open = False
-
-                # Calculate P&L
-                if pos.action == "SELL":
-                    pos.gross_pnl = (pos.entry_price - exit_price) * pos.quantity
-                else:
-                    pos.gross_pnl = (exit_price - pos.entry_price) * pos.quantity
-
-                # Calculate costs
-                pos.cost = self._cost_model.calculate(
-                    trade_date=self._trade_date,
-                    action=pos.action,
-                    premium=pos.entry_price,
-                    exit_premium=exit_price,
-                    quantity=pos.quantity,
-                    num_legs=1,
-                )
-                pos.net_pnl = pos.gross_pnl - pos.cost.total
-
-                self._closed_positions.append(pos)
-                self._positions.remove(pos)
-                return True
-        return False
+        pos = self._positions_by_id.get(position_id)
+        if pos is None or not pos.is_open:
+            return False
+
+        exit_price = price if price is not None else pos.current_price
+        self._finalize_close(pos, exit_price, reason, at_time)
+        return True
+
+    def _finalize_close(self, pos: Position, exit_price: float, reason: str,
+                         at_time: Optional[str], cost: Optional[TradeCost] = None):
+        """Mark a position closed and fill in P&L/costs. `cost` may be passed
+        in by batch paths (close_all); otherwise it is computed here."""
+        pos.exit_price = exit_price
+        pos.exit_time = at_time or ""
+        pos.exit_reason = reason
+        pos.is_open = False
+
+        # Calculate P&L
+        if pos.action == "SELL":
+            pos.gross_pnl = (pos.entry_price - exit_price) * pos.quantity
+        else:
+            pos.gross_pnl = (exit_price - pos.entry_price) * pos.quantity
+
+        # Calculate costs
+        if cost is None:
+            cost = self._cost_model.calculate(
+                trade_date=self._trade_date,
+                action=pos.action,
+                premium=pos.entry_price,
+                exit_premium=exit_price,
+                quantity=pos.quantity,
+                num_legs=1,
+            )
+        pos.cost = cost
+        pos.net_pnl = pos.gross_pnl - cost.total
+
+        self._closed_positions.append(pos)
+        self._open_ids.discard(pos.id)
 
     def close_all(self, reason: str = "close_all", price_map: Optional[dict] = None,
                    at_time: Optional[str] = None):
@@ -347,21 +486,33 @@ class StrategyContext:
             price_map: Optional dict of {position_id: exit_price}
             at_time: Exit time string "HH:MM"
         """
-        open_ids = [p.id for p in self._positions if p.is_open]
-        for pid in open_ids:
-            price = price_map.get(pid) if price_map else None
-            self.close_position(pid, price=price, reason=reason, at_time=at_time)
+        pids = sorted(self._open_ids)
+        if not pids:
+            return
+        closing = [self._positions_by_id[pid] for pid in pids]
+        exit_prices = []
+        for pos in closing:
+            price = price_map.get(pos.id) if price_map else None
+            exit_prices.append(price if price is not None else pos.current_price)
+
+        # One batched cost calculation for all legs closed at this instant
+        costs = self._cost_model.calculate_batch(
+            self._trade_date,
+            [p.action for p in closing],
+            [p.entry_price for p in closing],
+            exit_prices,
+            [p.quantity for p in closing],
+        )
+        for pos, exit_price, cost in zip(closing, exit_prices, costs):
+            self._finalize_close(pos, exit_price, reason, at_time, cost=cost)
 
     def get_open_positions(self) -> list[Position]:
         """Get all currently open positions."""
-        return [p for p in self._positions if p.is_open]
+        return [self._positions_by_id[pid] for pid in sorted(self._open_ids)]
 
     def get_position(self, position_id: int) -> Optional[Position]:
         """Get a specific position by ID (open or closed)."""
-        for p in self._positions + self._closed_positions:
-            if p.id == position_id:
-                return p
-        return None
+        return self._positions_by_id.get(position_id)
 
     def update_prices(self, candle_time):
         """
@@ -369,17 +520,13 @@ class StrategyContext:
         Accepts time object or 'HH:MM' string.
         """
         candle_time = self._to_time(candle_time)
-        for pos in self._positions:
-            if not pos.is_open:
-                continue
-            candles = self.get_candles(pos.strike, pos.option_type)
-            if candles.empty:
-                continue
-            mask = (candles["timestamp"].dt.hour == candle_time.hour) & \
-                   (candles["timestamp"].dt.minute == candle_time.minute)
-            rows = candles[mask]
-            if not rows.empty:
-                pos.current_price = float(rows.iloc[0]["close"])
+        h, m = candle_time.hour, candle_time.minute
+        price_idx = self._price_idx
+        for pid in self._open_ids:
+            pos = self._positions_by_id[pid]
+            entry = price_idx.get((pos.leg_code, h, m))
+            if entry is not None:
+                pos.current_price = entry[1]
 
     # ── P&L ──
 
@@ -388,7 +535,7 @@ class StrategyContext:
         Current combined P&L of all positions (realized + unrealized).
         """
         realized = sum(p.gross_pnl for p in self._closed_positions)
-        unrealized = sum(p.unrealized_pnl for p in self._positions if p.is_open)
+        unrealized = sum(self._positions_by_id[pid].unrealized_pnl for pid in self._open_ids)
         return realized + unrealized
 
     def get_realized_pnl(self) -> float:
@@ -397,49 +544,44 @@ class StrategyContext:
 
     def get_unrealized_pnl(self) -> float:
         """P&L from open positions only."""
-        return sum(p.unrealized_pnl for p in self._positions if p.is_open)
+        return sum(self._positions_by_id[pid].unrealized_pnl for pid in self._open_ids)
 
     # ── Logging ──
 
     def log(self, message: str):
         """Add a log message (included in results)."""
-        self._logs.append(f"[{self._trade_date}] {message}")
+        if message.startswith("["):
+            # Caller already prefixed the message — don't re-format
+            self._logs.append(message)
+        else:
+            self._logs.append(f"[{self._trade_date}] {message}")
 
     # ── Internal: Collect Results ──
 
     def _force_close_open_positions(self, reason: str = "time_exit"):
         """Close any positions still open at end of day."""
-        exit_h, exit_m = map(int, self._exit_time_str.split(":"))
-        exit_t = time(exit_h, exit_m)
-
-        for pos in list(self._positions):
-            if pos.is_open:
-                # Get price at exit time
-                candles = self.get_candles(pos.strike, pos.option_type)
-                exit_price = pos.current_price
-                if not candles.empty:
-                    mask = (candles["timestamp"].dt.hour >= exit_h)
-                    late_candles = candles[mask]
-                    if not late_candles.empty:
-                        exit_price = float(late_candles.iloc[0]["open"])
-
-                self.close_position(
-                    pos.id, price=exit_price, reason=reason,
-                    at_time=f"{exit_h:02d}:{exit_m:02d}",
-                )
+        at_time = f"{self._exit_time.hour:02d}:{self._exit_time.minute:02d}"
+        for pid in sorted(self._open_ids):
+            pos = self._positions_by_id[pid]
+            # Precomputed open of the first candle at/after exit time
+            exit_price = self._exit_open_price.get(pos.leg_code, pos.current_price)
+            self.close_position(pid, price=exit_price, reason=reason, at_time=at_time)
 
     def _collect_day_result(self) -> DayResult:
         """Collect all trades and logs for this day."""
         # Force-close any remaining open positions
         self._force_close_open_positions()
 
-        trades = []
-        for pos in self._closed_positions:
-            # Get absolute strike from data
-            candles = self.get_candles(pos.strike, pos.option_type)
-            abs_strike = float(candles.iloc[0]["absolute_strike"]) if not candles.empty else 0
+        # Single pass: preallocate the trade list and accumulate the day's
+        # P&L while building records, instead of a second sum() sweep
+        trades: list[TradeRecord] = [None] * len(self._closed_positions)  # type: ignore[list-item]
+        daily_pnl = 0.0
+        for i, pos in enumerate(self._closed_positions):
+            # Get absolute strike from the precomputed per-leg map
+            abs_strike = self._abs_strike.get(pos.leg_code, 0)
+            daily_pnl += pos.net_pnl
 
-            trades.append(TradeRecord(
+            trades[i] = TradeRecord(
                 trade_date=self._trade_date,
                 strike=pos.strike,
                 option_type=pos.option_type,
@@ -459,15 +601,13 @@ class StrategyContext:
                 vix_at_entry=self._vix,
                 label=pos.label,
                 cost=pos.cost,
-            ))
-
-        daily_pnl = sum(t.net_pnl for t in trades)
+            )
 
         return DayResult(
             trade_date=self._trade_date,
             trades=trades,
             daily_pnl=daily_pnl,
-            logs=self._logs.copy(),
+            logs=list(self._logs),
         )
 
 
@@ -475,7 +615,7 @@ class StrategyContext:
 # Strategy Result — aggregated across all days
 # =========================================================================
 
-@dataclass
+@dataclass(slots=True)
 class StrategyResult:
     """Complete result from a codegen backtest run."""
     strategy_name: str
@@ -491,6 +631,56 @@ class StrategyResult:
     skipped_days: list[dict] = field(default_factory=list)
     execution_errors: list[str] = field(default_factory=list)
 
+    # Cached metric arrays — every property below reads from these instead of
+    # re-walking the trade list in Python. Rebuilt automatically if trades
+    # were appended since the last access.
+    _net_cache: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    _gross_cache: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    _cost_cache: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    _stats_cache: Optional[tuple] = field(default=None, repr=False, compare=False)
+    _stats_len: int = field(default=-1, repr=False, compare=False)
+
+    def _net_array(self) -> np.ndarray:
+        if self._net_cache is None or self._net_cache.size != len(self.trades):
+            self._net_cache = np.fromiter(
+                (t.net_pnl for t in self.trades), np.float64, len(self.trades))
+        return self._net_cache
+
+    def _gross_array(self) -> np.ndarray:
+        if self._gross_cache is None or self._gross_cache.size != len(self.trades):
+            self._gross_cache = np.fromiter(
+                (t.gross_pnl for t in self.trades), np.float64, len(self.trades))
+        return self._gross_cache
+
+    def _cost_array(self) -> np.ndarray:
+        if self._cost_cache is None or self._cost_cache.size != len(self.trades):
+            self._cost_cache = np.fromiter(
+                (t.cost.total if t.cost else 0.0 for t in self.trades),
+                np.float64, len(self.trades))
+        return self._cost_cache
+
+    def _stats(self) -> tuple:
+        """Fused win/loss statistics computed in one pass over the net-pnl
+        array: (wins, losses, sum_pos, sum_neg, max_pos, min_neg, avg_pos,
+        avg_neg). The properties below all read from this tuple instead of
+        re-filtering the array independently."""
+        if self._stats_cache is None or self._stats_len != len(self.trades):
+            a = self._net_array()
+            wins = a[a > 0]
+            losses = a[a < 0]
+            self._stats_cache = (
+                int(wins.size),
+                int(losses.size),
+                float(wins.sum()),
+                float(losses.sum()),
+                float(wins.max()) if wins.size else 0.0,
+                float(losses.min()) if losses.size else 0.0,
+                float(wins.mean()) if wins.size else 0.0,
+                float(losses.mean()) if losses.size else 0.0,
+            )
+            self._stats_len = len(self.trades)
+        return self._stats_cache
+
     # ── Metrics (computed) ──
 
     @property
@@ -499,11 +689,11 @@ class StrategyResult:
 
     @property
     def winning_trades(self) -> int:
-        return len([t for t in self.trades if t.net_pnl > 0])
+        return self._stats()[0]
 
     @property
     def losing_trades(self) -> int:
-        return len([t for t in self.trades if t.net_pnl < 0])
+        return self._stats()[1]
 
     @property
     def win_rate(self) -> float:
@@ -511,51 +701,47 @@ class StrategyResult:
 
     @property
     def gross_pnl(self) -> float:
-        return sum(t.gross_pnl for t in self.trades)
+        return float(self._gross_array().sum())
 
     @property
     def total_cost(self) -> float:
-        return sum(t.cost.total for t in self.trades if t.cost)
+        return float(self._cost_array().sum())
 
     @property
     def net_pnl(self) -> float:
-        return sum(t.net_pnl for t in self.trades)
+        return float(self._net_array().sum())
 
     @property
     def max_drawdown(self) -> float:
-        equity = 0
-        peak = 0
-        max_dd = 0
-        for t in self.trades:
-            equity += t.net_pnl
-            peak = max(peak, equity)
-            max_dd = max(max_dd, peak - equity)
-        return max_dd
+        a = self._net_array()
+        if a.size == 0:
+            return 0
+        if _max_dd_nb is not None:
+            return float(_max_dd_nb(a))
+        equity = a.cumsum()
+        return float((np.maximum.accumulate(np.maximum(equity, 0)) - equity).max())
 
     @property
     def avg_win(self) -> float:
-        wins = [t.net_pnl for t in self.trades if t.net_pnl > 0]
-        return sum(wins) / len(wins) if wins else 0
+        return self._stats()[6]
 
     @property
     def avg_loss(self) -> float:
-        losses = [t.net_pnl for t in self.trades if t.net_pnl < 0]
-        return sum(losses) / len(losses) if losses else 0
+        return self._stats()[7]
 
     @property
     def max_win(self) -> float:
-        wins = [t.net_pnl for t in self.trades if t.net_pnl > 0]
-        return max(wins) if wins else 0
+        return self._stats()[4]
 
     @property
     def max_loss(self) -> float:
-        losses = [t.net_pnl for t in self.trades if t.net_pnl < 0]
-        return min(losses) if losses else 0
+        return self._stats()[5]
 
     @property
     def profit_factor(self) -> float:
-        gross_wins = sum(t.net_pnl for t in self.trades if t.net_pnl > 0)
-        gross_losses = abs(sum(t.net_pnl for t in self.trades if t.net_pnl < 0))
+        stats = self._stats()
+        gross_wins = stats[2]
+        gross_losses = abs(stats[3])
         return (gross_wins / gross_losses) if gross_losses > 0 else float('inf')
 
     @property
@@ -595,28 +781,29 @@ class StrategyResult:
         return self._max_consecutive(False)
 
     def _max_consecutive(self, winning: bool) -> int:
-        count = 0
-        max_count = 0
-        for t in self.trades:
-            if (winning and t.net_pnl > 0) or (not winning and t.net_pnl < 0):
-                count += 1
-                max_count = max(max_count, count)
-            else:
-                count = 0
-        return max_count
+        a = self._net_array()
+        if a.size == 0:
+            return 0
+        if _max_consec_nb is not None:
+            return int(_max_consec_nb(a, winning))
+        mask = a > 0 if winning else a < 0
+        if not mask.any():
+            return 0
+        # Longest run of True via edge detection on the padded mask
+        padded = np.concatenate(([False], mask, [False])).astype(np.int8)
+        edges = np.flatnonzero(np.diff(padded))
+        return int((edges[1::2] - edges[::2]).max())
 
     def equity_curve(self) -> list[dict]:
         """Build equity curve from daily P&L."""
-        curve = []
-        cumulative = 0
-        for d in sorted(self.daily_pnl.keys()):
-            cumulative += self.daily_pnl[d]
-            curve.append({
-                "date": str(d),
-                "daily_pnl": round(self.daily_pnl[d], 2),
-                "cumulative": round(cumulative, 2),
-            })
-        return curve
+        dates = sorted(self.daily_pnl)
+        vals = np.fromiter((self.daily_pnl[d] for d in dates), np.float64, len(dates))
+        cum = np.round(vals.cumsum(), 2)
+        vals = np.round(vals, 2)
+        return [
+            {"date": str(d), "daily_pnl": float(v), "cumulative": float(c)}
+            for d, v, c in zip(dates, vals, cum)
+        ]
 
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dict for API response."""
@@ -629,8 +816,18 @@ class StrategyResult:
                 return round(v, 2)
             return v
 
+        # Round the numeric columns in one vectorized pass instead of six
+        # round() calls per trade
+        n = len(self.trades)
+        entry_prices = np.round(np.fromiter((t.entry_price for t in self.trades), np.float64, n), 2)
+        exit_prices = np.round(np.fromiter((t.exit_price for t in self.trades), np.float64, n), 2)
+        gross = np.round(self._gross_array(), 2)
+        net = np.round(self._net_array(), 2)
+        spots = np.round(np.fromiter((t.spot_at_entry for t in self.trades), np.float64, n), 2)
+        vixes = np.round(np.fromiter((t.vix_at_entry for t in self.trades), np.float64, n), 2)
+
         trades_list = []
-        for t in self.trades:
+        for i, t in enumerate(self.trades):
             trades_list.append({
                 "date": str(t.trade_date),
                 "strike": t.strike,
@@ -638,16 +835,16 @@ class StrategyResult:
                 "absolute_strike": t.absolute_strike,
                 "action": t.action,
                 "lots": t.lots,
-                "entry_price": round(t.entry_price, 2),
-                "exit_price": round(t.exit_price, 2),
+                "entry_price": float(entry_prices[i]),
+                "exit_price": float(exit_prices[i]),
                 "entry_time": t.entry_time,
                 "exit_time": t.exit_time,
                 "exit_reason": t.exit_reason,
-                "gross_pnl": round(t.gross_pnl, 2),
-                "net_pnl": round(t.net_pnl, 2),
+                "gross_pnl": float(gross[i]),
+                "net_pnl": float(net[i]),
                 "dte": t.dte,
-                "spot": round(t.spot_at_entry, 2),
-                "vix": round(t.vix_at_entry, 2),
+                "spot": float(spots[i]),
+                "vix": float(vixes[i]),
                 "label": t.label,
                 "leg": t.label or f"{t.action} {t.strike} {t.option_type}",
                 "costs": t.cost.to_dict() if t.cost else {},
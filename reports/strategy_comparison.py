@@ -9,9 +9,13 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 from datetime import datetime
-import json
+import os
 
-from reports.report_generator import ReportData, generate_report
+import numpy as np
+
+from reports.report_generator import (
+    ReportData, _CHART_JS_SRC, _dumps, _ensure_dir, generate_report,
+)
 
 
 @dataclass
@@ -24,15 +28,36 @@ class StrategyResult:
     metrics: Dict[str, float] = field(default_factory=dict)
     equity_curve: List[Dict] = field(default_factory=list)
     trades: List[Dict] = field(default_factory=list)
+    # Serialized chart payloads, filled on first render — reused when the same
+    # strategy appears in several comparison/individual reports
+    _cached_chart_json: Dict[str, str] = field(default_factory=dict, repr=False, compare=False)
 
 
 @dataclass
 class ComparisonResult:
     """Result of comparing multiple strategies."""
     strategies: List[StrategyResult]
-    rankings: Dict[str, List[str]] = field(default_factory=dict)
     best_overall: str = ""
     summary_table: List[Dict] = field(default_factory=list)
+    # (names, keys, sort_key matrix, n_valid) — raw material for the per-metric
+    # name orderings, which only the reports need and which are built on demand
+    _ranking_data: Optional[tuple] = field(default=None, repr=False, compare=False)
+    _rankings: Optional[Dict[str, List[str]]] = field(default=None, repr=False, compare=False)
+
+    @property
+    def rankings(self) -> Dict[str, List[str]]:
+        """Per-metric strategy name orderings, best first (computed lazily)."""
+        if self._rankings is None:
+            rankings: Dict[str, List[str]] = {}
+            if self._ranking_data is not None:
+                names, keys, sort_key, n_valid = self._ranking_data
+                order = np.argsort(sort_key, axis=0, kind="stable")
+                for j, key in enumerate(keys):
+                    nv = int(n_valid[j])
+                    if nv:
+                        rankings[key] = [names[i] for i in order[:nv, j]]
+            self._rankings = rankings
+        return self._rankings
 
 
 # =============================================================================
@@ -70,34 +95,40 @@ def compare_strategies(strategies: List[StrategyResult]) -> ComparisonResult:
     for strat in strategies:
         all_keys.update(strat.metrics.keys())
 
-    # Rank each metric
-    rankings: Dict[str, List[str]] = {}
-    scores: Dict[str, float] = {s.name: 0 for s in strategies}
-
-    for key in sorted(all_keys):
-        # Get values for each strategy
-        vals = []
-        for s in strategies:
-            val = s.metrics.get(key)
+    names = [s.name for s in strategies]
+    keys = sorted(all_keys)
+    n_strats = len(strategies)
+
+    # Rank via one (n_strategies × n_metrics) float matrix instead of a
+    # Python sort per metric. Missing metrics become NaN, which argsort
+    # pushes to the end of each column.
+    mat = np.full((n_strats, len(keys)), np.nan)
+    for i, strat in enumerate(strategies):
+        metrics = strat.metrics
+        for j, key in enumerate(keys):
+            val = metrics.get(key)
             if val is not None:
-                vals.append((s.name, val))
+                mat[i, j] = val
 
-        if not vals:
-            continue
+    # Normalize every column to "ascending sort = best first":
+    # higher-better (and unknown) metrics are negated, lower-better ones
+    # compare by magnitude.
+    lower = np.fromiter((k in _LOWER_BETTER for k in keys), dtype=bool, count=len(keys))
+    sort_key = np.where(lower[np.newaxis, :], np.abs(mat), -mat)
 
-        # Sort
-        if key in _HIGHER_BETTER:
-            sorted_vals = sorted(vals, key=lambda x: x[1], reverse=True)
-        elif key in _LOWER_BETTER:
-            sorted_vals = sorted(vals, key=lambda x: abs(x[1]))
-        else:
-            sorted_vals = sorted(vals, key=lambda x: x[1], reverse=True)
+    n_valid = n_strats - np.isnan(mat).sum(axis=0)
 
-        rankings[key] = [name for name, _ in sorted_vals]
+    # Points from rank with linear weights don't actually need a sort: a
+    # strategy's points on a metric equal the number of strictly worse
+    # strategies plus one. One broadcasted comparison scores every metric at
+    # once (NaN compares false on both sides, so missing entries neither earn
+    # nor grant points). Ties now share the same points instead of being
+    # split by input order.
+    valid = ~np.isnan(mat)
+    beats = (sort_key[:, np.newaxis, :] < sort_key[np.newaxis, :, :]).sum(axis=1)
+    score_arr = np.where(valid, beats + 1, 0).sum(axis=1).astype(float)
 
-        # Award points (1st = N points, 2nd = N-1, etc.)
-        for rank, (name, _) in enumerate(sorted_vals):
-            scores[name] += len(sorted_vals) - rank
+    scores: Dict[str, float] = {name: float(score_arr[i]) for i, name in enumerate(names)}
 
     # Best overall
     best_overall = max(scores, key=lambda k: scores[k]) if scores else ""
@@ -122,9 +153,9 @@ def compare_strategies(strategies: List[StrategyResult]) -> ComparisonResult:
 
     return ComparisonResult(
         strategies=strategies,
-        rankings=rankings,
         best_overall=best_overall,
         summary_table=summary_table,
+        _ranking_data=(names, keys, sort_key, n_valid),
     )
 
 
@@ -172,6 +203,68 @@ def print_comparison(result: ComparisonResult) -> None:
 # HTML Comparison Report
 # =============================================================================
 
+_CSS = """
+:root{--bg:#0a0e17;--bg2:#111827;--bg3:#1a2236;--card:#151d2e;--border:rgba(255,255,255,0.08);--text:#f1f5f9;--text2:#94a3b8;--text3:#64748b;--accent:#38bdf8;--green:#22c55e;--red:#ef4444}
+*{box-sizing:border-box;margin:0;padding:0}
+body{font-family:'Inter',system-ui,sans-serif;background:var(--bg);color:var(--text);font-size:13px;line-height:1.5;padding:32px;max-width:1200px;margin:0 auto}
+.header{text-align:center;margin-bottom:32px;padding-bottom:24px;border-bottom:1px solid var(--border)}
+.header h1{font-size:24px;font-weight:800;background:linear-gradient(135deg,#38bdf8,#818cf8);-webkit-background-clip:text;-webkit-text-fill-color:transparent;margin-bottom:8px}
+.header .subtitle{color:var(--text3);font-size:13px}
+.section{margin-bottom:32px}
+.section-title{font-size:14px;font-weight:700;text-transform:uppercase;letter-spacing:1px;color:var(--text3);margin-bottom:16px;padding-bottom:8px;border-bottom:1px solid var(--border)}
+table{width:100%;border-collapse:collapse;background:var(--card);border-radius:8px;overflow:hidden;border:1px solid var(--border)}
+th{padding:10px 14px;text-align:left;font-size:10px;font-weight:600;text-transform:uppercase;letter-spacing:0.8px;color:var(--text3);background:var(--bg3);border-bottom:1px solid var(--border)}
+td{padding:8px 14px;font-size:12px;color:var(--text2);border-bottom:1px solid var(--border)}
+tr:last-child td{border-bottom:none}
+.text-mono{font-family:'JetBrains Mono',monospace}
+.chart-container{background:var(--card);border:1px solid var(--border);border-radius:8px;padding:20px}
+canvas{width:100%!important;border-radius:8px}
+.row{display:flex;gap:16px}
+.flex-1{flex:1}.flex-2{flex:2}
+.footer{text-align:center;padding-top:24px;border-top:1px solid var(--border);color:var(--text3);font-size:11px}
+"""
+
+# Page skeleton compiled once at import; format_map fills in the dynamic
+# fields so the giant f-string isn't re-assembled per call. Everything up to
+# <body> (including the CSS, which contains literal braces) is fully static,
+# so it lives in a plain prefix string that never goes through format parsing.
+_HTML_PREFIX = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8"><meta name="viewport" content="width=device-width,initial-scale=1.0">
+<title>Strategy Comparison</title>
+<link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&family=JetBrains+Mono:wght@400;500&display=swap" rel="stylesheet">
+<script src=\"""" + _CHART_JS_SRC + """\"></script>
+<style>""" + _CSS + """</style>
+</head>
+<body>
+"""
+
+_BODY_TEMPLATE = """<div class="header">
+  <h1>Strategy Comparison Report</h1>
+  <div class="subtitle">{num_strategies} strategies compared &middot; Generated: {generated_at}</div>
+</div>
+
+<div class="section">
+  <div class="section-title">Overall Ranking</div>
+  {ranking_html}
+</div>
+
+<div class="section">
+  <div class="section-title">Metrics Comparison</div>
+  <table>
+    <thead><tr><th>Metric</th>{th_cols}</tr></thead>
+    <tbody>{rows_html}</tbody>
+  </table>
+</div>
+
+{equity_section}
+
+<div class="footer">Antigravity Trading Platform &middot; Strategy Comparison Report</div>
+<script>{chart_js}</script>
+</body></html>"""
+
+
 def generate_comparison_report(
     result: ComparisonResult,
     output_path: Optional[str] = None,
@@ -201,16 +294,16 @@ def generate_comparison_report(
     strat_names = [s.name for s in result.strategies]
     th_cols = "".join(f"<th>{name}</th>" for name in strat_names)
 
-    # Table rows
-    rows_html = ""
+    # Table rows — build fragments in lists and join once (str += is O(n²))
+    row_parts = []
     for key in compare_metrics:
         label = metric_labels.get(key, key)
         ranking = result.rankings.get(key, [])
-        cells = ""
+        cell_parts = []
         for strat in result.strategies:
             val = strat.metrics.get(key)
             if val is None:
-                cells += "<td>—</td>"
+                cell_parts.append("<td>—</td>")
                 continue
 
             is_best = ranking and ranking[0] == strat.name
@@ -225,9 +318,10 @@ def generate_comparison_report(
             else:
                 text = f"{val:.2f}"
 
-            cells += f"<td class=\"text-mono\"{style}>{text}</td>"
+            cell_parts.append(f"<td class=\"text-mono\"{style}>{text}</td>")
 
-        rows_html += f"<tr><td style='color:var(--text2)'>{label}</td>{cells}</tr>"
+        row_parts.append(f"<tr><td style='color:var(--text2)'>{label}</td>{''.join(cell_parts)}</tr>")
+    rows_html = "".join(row_parts)
 
     # Equity curves chart data
     chart_js = ""
@@ -235,10 +329,13 @@ def generate_comparison_report(
         colors = ["#38bdf8", "#a78bfa", "#22c55e", "#eab308", "#f87171"]
         datasets = []
         max_len = max((len(s.equity_curve) for s in result.strategies), default=0)
-        labels = json.dumps([f"Day {i+1}" for i in range(max_len)])
+        labels = _dumps([f"Day {i+1}" for i in range(max_len)])
 
         for i, strat in enumerate(result.strategies):
-            values = json.dumps([e.get("equity", 0) for e in strat.equity_curve])
+            values = strat._cached_chart_json.get("equity_values")
+            if values is None:
+                values = _dumps([e.get("equity", 0) for e in strat.equity_curve])
+                strat._cached_chart_json["equity_values"] = values
             color = colors[i % len(colors)]
             datasets.append(f"""{{
                 label: '{strat.name}',
@@ -265,80 +362,46 @@ new Chart(document.getElementById('compChart'), {{
 }});"""
 
     # Overall ranking
-    ranking_html = ""
+    ranking_parts = []
     for row in result.summary_table:
         medal = "🥇" if row["rank"] == 1 else "🥈" if row["rank"] == 2 else "🥉" if row["rank"] == 3 else f"#{row['rank']}"
-        ranking_html += f"""<div style="display:flex;align-items:center;gap:12px;padding:12px 16px;
+        ranking_parts.append(f"""<div style="display:flex;align-items:center;gap:12px;padding:12px 16px;
             background:var(--card);border:1px solid var(--border);border-radius:8px;margin-bottom:8px">
             <span style="font-size:20px">{medal}</span>
             <span style="font-weight:700;flex:1">{row['name']}</span>
             <span style="color:var(--text3)">Score: {row['score']:.0f}</span>
-        </div>"""
-
-    css = """
-:root{--bg:#0a0e17;--bg2:#111827;--bg3:#1a2236;--card:#151d2e;--border:rgba(255,255,255,0.08);--text:#f1f5f9;--text2:#94a3b8;--text3:#64748b;--accent:#38bdf8;--green:#22c55e;--red:#ef4444}
-*{box-sizing:border-box;margin:0;padding:0}
-body{font-family:'Inter',system-ui,sans-serif;background:var(--bg);color:var(--text);font-size:13px;line-height:1.5;padding:32px;max-width:1200px;margin:0 auto}
-.header{text-align:center;margin-bottom:32px;padding-bottom:24px;border-bottom:1px solid var(--border)}
-.header h1{font-size:24px;font-weight:800;background:linear-gradient(135deg,#38bdf8,#818cf8);-webkit-background-clip:text;-webkit-text-fill-color:transparent;margin-bottom:8px}
-.header .subtitle{color:var(--text3);font-size:13px}
-.section{margin-bottom:32px}
-.section-title{font-size:14px;font-weight:700;text-transform:uppercase;letter-spacing:1px;color:var(--text3);margin-bottom:16px;padding-bottom:8px;border-bottom:1px solid var(--border)}
-table{width:100%;border-collapse:collapse;background:var(--card);border-radius:8px;overflow:hidden;border:1px solid var(--border)}
-th{padding:10px 14px;text-align:left;font-size:10px;font-weight:600;text-transform:uppercase;letter-spacing:0.8px;color:var(--text3);background:var(--bg3);border-bottom:1px solid var(--border)}
-td{padding:8px 14px;font-size:12px;color:var(--text2);border-bottom:1px solid var(--border)}
-tr:last-child td{border-bottom:none}
-.text-mono{font-family:'JetBrains Mono',monospace}
-.chart-container{background:var(--card);border:1px solid var(--border);border-radius:8px;padding:20px}
-canvas{width:100%!important;border-radius:8px}
-.row{display:flex;gap:16px}
-.flex-1{flex:1}.flex-2{flex:2}
-.footer{text-align:center;padding-top:24px;border-top:1px solid var(--border);color:var(--text3);font-size:11px}
-"""
-
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8"><meta name="viewport" content="width=device-width,initial-scale=1.0">
-<title>Strategy Comparison</title>
-<link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&family=JetBrains+Mono:wght@400;500&display=swap" rel="stylesheet">
-<script src="https://cdn.jsdelivr.net/npm/chart.js@4/dist/chart.umd.min.js"></script>
-<style>{css}</style>
-</head>
-<body>
-<div class="header">
-  <h1>Strategy Comparison Report</h1>
-  <div class="subtitle">{len(result.strategies)} strategies compared &middot; Generated: {datetime.now().strftime('%Y-%m-%d %H:%M IST')}</div>
-</div>
-
-<div class="section">
-  <div class="section-title">Overall Ranking</div>
-  {ranking_html}
-</div>
-
-<div class="section">
-  <div class="section-title">Metrics Comparison</div>
-  <table>
-    <thead><tr><th>Metric</th>{th_cols}</tr></thead>
-    <tbody>{rows_html}</tbody>
-  </table>
-</div>
-
-{"<div class='section'><div class='section-title'>Equity Curves</div><div class='chart-container'><canvas id='compChart' height='100'></canvas></div></div>" if chart_js else ""}
-
-<div class="footer">Antigravity Trading Platform &middot; Strategy Comparison Report</div>
-<script>{chart_js}</script>
-</body></html>"""
+        </div>""")
+    ranking_html = "".join(ranking_parts)
+
+    # One clock read per report — reused for the page header and the filename
+    now = datetime.now()
+
+    html = _HTML_PREFIX + _BODY_TEMPLATE.format_map({
+        "num_strategies": len(result.strategies),
+        "generated_at": now.strftime("%Y-%m-%d %H:%M IST"),
+        "ranking_html": ranking_html,
+        "th_cols": th_cols,
+        "rows_html": rows_html,
+        "equity_section": (
+            "<div class='section'><div class='section-title'>Equity Curves</div>"
+            "<div class='chart-container'><canvas id='compChart' height='100'></canvas></div></div>"
+            if chart_js else ""
+        ),
+        "chart_js": chart_js,
+    })
 
     if output_path is None:
         reports_dir = Path("reports")
         reports_dir.mkdir(exist_ok=True)
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        ts = now.strftime("%Y%m%d_%H%M%S")
         output_path = str(reports_dir / f"comparison_{ts}.html")
 
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html)
+    _ensure_dir(str(Path(output_path).parent))
+    # Single write syscall, atomically swapped in so parallel report workers
+    # never see a half-written comparison page
+    tmp_path = output_path + ".tmp"
+    Path(tmp_path).write_text(html, encoding="utf-8")
+    os.replace(tmp_path, output_path)
 
     return output_path
 
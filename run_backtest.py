@@ -7,6 +7,7 @@ Usage:
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -17,11 +18,37 @@ import pandas as pd
 import numpy as np
 
 from core.config import load_settings
-from core.models import Exchange, Instrument, Interval, Segment, Candle
+from core.models import Exchange, Instrument, Interval, Segment
 from data.storage import DataStorage
 from engine.backtester import Backtester
 from strategy.examples.simple_ma_crossover import MACrossoverStrategy
 
+try:  # Optional: numba fuses the walk + wick assembly into one compiled pass
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _walk_nb(price0, growth, wick_hi, wick_lo):
+        n = growth.shape[0]
+        open_ = np.empty(n)
+        high = np.empty(n)
+        low = np.empty(n)
+        close = np.empty(n)
+        prev = price0
+        for i in range(n):
+            c = prev * growth[i]
+            o = prev
+            body_high = o if o > c else c
+            body_low = o if o < c else c
+            open_[i] = o
+            high[i] = body_high + wick_hi[i] * o
+            low[i] = body_low - wick_lo[i] * o
+            close[i] = c
+            prev = c
+        return open_, high, low, close
+
 
 def generate_sample_data(
     instrument: Instrument,
@@ -33,50 +60,62 @@ def generate_sample_data(
     Generate synthetic OHLCV data for testing.
     Uses random walk with drift to simulate realistic price movement.
     """
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     total_candles = days * candles_per_day
-    
+
     # Start at realistic price
-    price = 22000.0  # Nifty-like
+    price0 = 22000.0  # Nifty-like
     timestamps = pd.date_range(
         start="2024-01-01 09:15",
         periods=total_candles,
         freq="5min",
     )
-    
-    data = []
-    for ts in timestamps:
-        # Skip non-market hours
-        if ts.hour < 9 or ts.hour >= 16:
-            continue
-        if ts.hour == 9 and ts.minute < 15:
-            continue
-        if ts.hour == 15 and ts.minute > 30:
-            continue
-            
-        # Random walk
-        change = np.random.normal(0, 0.001) * price  # ~0.1% per candle
-        trend = 0.00002 * price  # Slight upward drift
-        
-        open_price = price
-        close_price = price + change + trend
-        high_price = max(open_price, close_price) + abs(np.random.normal(0, 0.0005) * price)
-        low_price = min(open_price, close_price) - abs(np.random.normal(0, 0.0005) * price)
-        volume = int(np.random.lognormal(10, 1))
-        
-        data.append({
-            "timestamp": ts,
-            "open": round(open_price, 2),
-            "high": round(high_price, 2),
-            "low": round(low_price, 2),
-            "close": round(close_price, 2),
-            "volume": volume,
-            "oi": 0,
-        })
-        
-        price = close_price
-    
-    return pd.DataFrame(data)
+
+    # Keep market hours (09:15-15:30) only — one boolean mask over raw
+    # ndarrays instead of per-row comparisons
+    h = timestamps.hour.values
+    m = timestamps.minute.values
+    market_hours = (
+        ((h > 9) | ((h == 9) & (m >= 15)))
+        & ((h < 15) | ((h == 15) & (m <= 30)))
+    )
+    timestamps = timestamps[market_hours]
+    n = len(timestamps)
+
+    # Random walk with drift: each close is the previous close times
+    # (1 + noise + trend), so the whole path is one cumprod. All random
+    # draws happen in three array calls instead of three per candle.
+    changes = rng.normal(0, 0.001, n)   # ~0.1% per candle
+    trend = 0.00002                     # Slight upward drift
+    growth = 1.0 + changes + trend
+    wick_hi = np.abs(rng.normal(0, 0.0005, n))
+    wick_lo = np.abs(rng.normal(0, 0.0005, n))
+
+    if njit is not None:
+        # Compiled single pass: no intermediate cumprod/maximum/minimum
+        # temporaries. Same draws, so the walk matches the NumPy path.
+        open_, high, low, close = _walk_nb(price0, growth, wick_hi, wick_lo)
+    else:
+        close = price0 * np.cumprod(growth)
+        open_ = np.empty(n)
+        open_[0] = price0
+        open_[1:] = close[:-1]
+        body_high = np.maximum(open_, close)
+        body_low = np.minimum(open_, close)
+        high = body_high + wick_hi * open_
+        low = body_low - wick_lo * open_
+
+    volume = rng.lognormal(10, 1, n).astype(np.int64)
+
+    return pd.DataFrame({
+        "timestamp": timestamps,
+        "open": np.round(open_, 2),
+        "high": np.round(high, 2),
+        "low": np.round(low, 2),
+        "close": np.round(close, 2),
+        "volume": volume,
+        "oi": np.zeros(n, dtype=np.int64),
+    })
 
 
 def main():
@@ -104,22 +143,16 @@ def main():
     storage = DataStorage()
     df = storage.load_candles(instrument, interval, from_dt, to_dt)
     
+    save_pool = None
+    save_future = None
     if df.empty:
         print("\n[!] No real data found. Generating synthetic data for demo...")
         print("   (To use real data, fetch from Dhan first)\n")
         df = generate_sample_data(instrument, interval)
-        storage.save_candles(
-            [Candle(
-                timestamp=row["timestamp"],
-                open=row["open"], high=row["high"],
-                low=row["low"], close=row["close"],
-                volume=row["volume"], oi=row["oi"],
-                instrument=instrument, interval=interval,
-            ) for _, row in df.iterrows()],
-            instrument, interval,
-        )
-        # Reload
-        df = storage.load_candles(instrument, interval, from_dt, to_dt)
+        # Bulk columnar save, fired off in the background — the backtest
+        # runs on the in-memory frame and never waits for the Parquet write
+        save_pool = ThreadPoolExecutor(max_workers=1)
+        save_future = save_pool.submit(storage.save_candles_df, df, instrument, interval)
     
     print(f"  Instrument : {instrument.display_name}")
     print(f"  Interval   : {interval.value}")
@@ -139,14 +172,21 @@ def main():
         storage=storage,
     )
     
+    # Hand the already-loaded frame to the backtester directly — without
+    # this it would re-read the Parquet file we just wrote
     result = backtester.run(
         strategy=strategy,
         instruments=[instrument],
         interval=interval,
         from_dt=from_dt,
         to_dt=to_dt,
+        data={f"{instrument.display_name}_{interval.value}": df},
     )
-    
+
+    if save_future is not None:
+        save_future.result()
+        save_pool.shutdown()
+
     print(result.summary())
     
     # Print first 5 trades
@@ -0,0 +1,50 @@
+"""Shared HTTP client for the one-off scripts.
+
+One module-level httpx.Client keeps TLS sessions and TCP connections
+pooled across calls, instead of each httpx.get() paying a fresh
+handshake. Scripts import get_client() rather than creating ad-hoc
+clients.
+"""
+import asyncio
+import atexit
+
+import httpx
+
+DEFAULT_TIMEOUT = 30.0
+
+# HTTP/2 multiplexes concurrent requests over one connection, but httpx
+# needs the optional h2 package for it; negotiate it only when installed
+# (ALPN falls back to HTTP/1.1 against servers that don't offer h2).
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+_client = None
+
+
+class RateSpacer:
+    """Spaces async request starts at least `interval` seconds apart."""
+
+    def __init__(self, interval: float):
+        self._interval = interval
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def wait(self) -> None:
+        async with self._lock:
+            now = asyncio.get_event_loop().time()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def get_client() -> httpx.Client:
+    """Return the process-wide pooled client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.Client(timeout=DEFAULT_TIMEOUT, follow_redirects=True)
+        atexit.register(_client.close)
+    return _client
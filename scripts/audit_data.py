@@ -1,54 +1,127 @@
 """Audit NIFTY options data month-by-month."""
+import json
+import sqlite3
 import pandas as pd
+from pyarrow import csv as pacsv
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from collections import defaultdict
 
 opts_dir = Path(r"C:\Users\sanja\Desktop\Reset\Antigravity Trading\storage\candles\nifty_options")
-files = sorted(opts_dir.glob("*.csv"))
+# Prefer Parquet (typed, compressed, projection push-down); fall back to
+# legacy CSV dumps
+files = sorted(opts_dir.glob("*.parquet")) or sorted(opts_dir.glob("*.csv"))
+
+# The audit only touches these columns — skipping OHLC cuts read time
+AUDIT_COLUMNS = ["timestamp", "type", "strike_rel", "spot_price", "india_vix", "oi"]
+
+# Sidecar cache: per-file monthly contributions keyed by (path, mtime,
+# size), so reruns only rescan files that actually changed
+CACHE_DB = opts_dir / "audit_cache.db"
 
 print("Loading all options files...")
-monthly = defaultdict(lambda: {
-    "candles": 0, "strikes": set(), "types": set(),
-    "has_spot": False, "has_vix": False, "has_oi": False,
-    "ce_count": 0, "pe_count": 0,
-})
 
-for i, f in enumerate(files):
-    df = pd.read_csv(f)
 
-    # Handle timestamp - could be epoch or string
+def read_one(f: Path) -> pd.DataFrame:
+    if f.suffix == ".parquet":
+        try:
+            # Timestamps come back as datetime64 directly — no reparsing
+            return pd.read_parquet(f, columns=AUDIT_COLUMNS)
+        except Exception:
+            return pd.read_parquet(f)
+
+    # Arrow's multithreaded C++ CSV reader with column projection; legacy
+    # dumps may lack some audit columns, so fall back to a full read
+    try:
+        table = pacsv.read_csv(
+            f, convert_options=pacsv.ConvertOptions(include_columns=AUDIT_COLUMNS),
+        )
+    except Exception:
+        table = pacsv.read_csv(f)
+    df = table.to_pandas()
+
+    # Handle timestamp - could be epoch, string, or already parsed by Arrow
     if df["timestamp"].dtype in ("int64", "float64"):
         df["timestamp"] = pd.to_datetime(df["timestamp"], unit="s")
-    else:
+    elif df["timestamp"].dtype == object:
         df["timestamp"] = pd.to_datetime(df["timestamp"], format="mixed")
+    return df
+
+
+def summarize_one(f: Path) -> list:
+    """One file's per-month contribution to the audit (vectorized)."""
+    df = read_one(f)
+    df["month"] = df["timestamp"].dt.to_period("M").astype(str)
+    rows = []
+    for month, g in df.groupby("month"):
+        rows.append({
+            "month": month,
+            "candles": int(len(g)),
+            "ce_count": int((g["type"] == "CALL").sum()) if "type" in g.columns else 0,
+            "pe_count": int((g["type"] == "PUT").sum()) if "type" in g.columns else 0,
+            "strikes": sorted(g["strike_rel"].dropna().unique().tolist()) if "strike_rel" in g.columns else [],
+            "types": sorted(g["type"].dropna().unique().tolist()) if "type" in g.columns else [],
+            "has_spot": bool(g["spot_price"].notna().any()) if "spot_price" in g.columns else False,
+            "has_vix": bool(g["india_vix"].notna().any()) if "india_vix" in g.columns else False,
+            "has_oi": bool((g["oi"] > 0).any()) if "oi" in g.columns else False,
+        })
+    return rows
+
+
+conn = sqlite3.connect(CACHE_DB)
+conn.execute("""
+    CREATE TABLE IF NOT EXISTS file_summary (
+        path TEXT, mtime REAL, size INT, months TEXT,
+        PRIMARY KEY (path, mtime, size)
+    )
+""")
+
+# Split into cache hits (unchanged files, summary comes straight from the
+# sidecar DB) and misses that need a real scan
+cached_rows = []
+to_scan = []
+for f in files:
+    st = f.stat()
+    hit = conn.execute(
+        "SELECT months FROM file_summary WHERE path=? AND mtime=? AND size=?",
+        (str(f), st.st_mtime, st.st_size),
+    ).fetchone()
+    if hit:
+        cached_rows.extend(json.loads(hit[0]))
+    else:
+        to_scan.append((f, st))
+
+# Reading is I/O-bound (pandas releases the GIL while parsing), so a thread
+# pool overlaps the file reads instead of walking them one by one
+if to_scan:
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        scanned = list(ex.map(summarize_one, (f for f, _ in to_scan)))
+    for (f, st), rows in zip(to_scan, scanned):
+        conn.execute(
+            "INSERT OR REPLACE INTO file_summary VALUES (?, ?, ?, ?)",
+            (str(f), st.st_mtime, st.st_size, json.dumps(rows)),
+        )
+        cached_rows.extend(rows)
+    conn.commit()
+conn.close()
+
+print(f"  Done: {len(files)} files ({len(files) - len(to_scan)} cached).\n")
 
-    df["month"] = df["timestamp"].dt.to_period("M")
-
-    for month, grp in df.groupby("month"):
-        m = str(month)
-        info = monthly[m]
-        info["candles"] += len(grp)
-
-        if "strike_rel" in grp.columns:
-            info["strikes"].update(grp["strike_rel"].unique())
-        if "type" in grp.columns:
-            info["types"].update(grp["type"].unique())
-            info["ce_count"] += len(grp[grp["type"] == "CALL"])
-            info["pe_count"] += len(grp[grp["type"] == "PUT"])
-        if "spot_price" in grp.columns:
-            if grp["spot_price"].notna().sum() > 0:
-                info["has_spot"] = True
-        if "india_vix" in grp.columns:
-            if grp["india_vix"].notna().sum() > 0:
-                info["has_vix"] = True
-        if "oi" in grp.columns:
-            if (grp["oi"] > 0).sum() > 0:
-                info["has_oi"] = True
-
-    if (i + 1) % 100 == 0:
-        print(f"  Processed {i+1}/{len(files)} files...")
-
-print(f"  Done: {len(files)} files.\n")
+# Fold per-file contributions into the monthly aggregate
+monthly = {}
+for row in cached_rows:
+    info = monthly.setdefault(row["month"], {
+        "candles": 0, "strikes": set(), "types": set(),
+        "has_spot": False, "has_vix": False, "has_oi": False,
+        "ce_count": 0, "pe_count": 0,
+    })
+    info["candles"] += row["candles"]
+    info["ce_count"] += row["ce_count"]
+    info["pe_count"] += row["pe_count"]
+    info["strikes"].update(row["strikes"])
+    info["types"].update(row["types"])
+    info["has_spot"] |= row["has_spot"]
+    info["has_vix"] |= row["has_vix"]
+    info["has_oi"] |= row["has_oi"]
 
 # Print report
 print("=" * 97)
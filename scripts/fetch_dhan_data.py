@@ -5,7 +5,7 @@ Downloads 1-minute OHLCV data from Dhan API for:
   NIFTY, BANKNIFTY, Crude Oil, Natural Gas, Gold, Silver, India VIX
   across Spot, Futures, and Options.
 
-Saves to CSV files in storage/candles/ directory.
+Saves to Parquet files in storage/candles/ directory.
 
 Usage:
     python scripts/fetch_dhan_data.py                        # full 5-year fetch
@@ -14,39 +14,51 @@ Usage:
     python scripts/fetch_dhan_data.py --skip-futures --skip-options  # spot only
 """
 
+import asyncio
 import os
 import sys
 import time
 import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 from io import StringIO
 
+import httpx
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from dotenv import load_dotenv
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from _http import HTTP2_AVAILABLE, RateSpacer, get_client
+
 
 # =============================================================================
 # Configuration
 # =============================================================================
 
-DHAN_CLIENT_ID = "1110311427"
-DHAN_ACCESS_TOKEN = (
-    "eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzUxMiJ9."
-    "eyJpc3MiOiJkaGFuIiwicGFydG5lcklkIjoiIiwiZXhwIjoxNzcxNjQ0NDkyLCJ"
-    "pYXQiOjE3NzE1NTgwOTIsInRva2VuQ29uc3VtZXJUeXBlIjoiU0VMRiIsIndlYm"
-    "hvb2tVcmwiOiIiLCJkaGFuQ2xpZW50SWQiOiIxMTEwMzExNDI3In0."
-    "9o98J2d7Ih59kqx66OU9bvpJrKJBKOl-AB8n_wtnF1sPBGhSojl69BrvmPq8z1R"
-    "eR6228fotMBEF7Xiv4k69GQ"
-)
+# Credentials live in .env (same pattern as GEMINI_API_KEY) — never in
+# the repo. The token is a short-lived JWT, so reruns after expiry must
+# fail fast instead of sleeping through every chunk of every instrument.
+load_dotenv(PROJECT_ROOT / ".env")
+DHAN_CLIENT_ID = os.environ.get("DHAN_CLIENT_ID", "")
+DHAN_ACCESS_TOKEN = os.environ.get("DHAN_ACCESS_TOKEN", "")
 
 STORAGE_DIR = PROJECT_ROOT / "storage" / "candles"
 CHUNK_DAYS = 85       # max 90 per Dhan, use 85 for safety
 RATE_LIMIT_SLEEP = 0.4
 MAX_HISTORY_DAYS = 365 * 5  # 5 years
+MAX_CONCURRENT_CHUNKS = 8
+
+DHAN_INTRADAY_URL = "https://api.dhan.co/v2/charts/intraday"
+
+MASTER_CACHE = STORAGE_DIR / "instrument_master.parquet"
+MASTER_CACHE_TTL = 12 * 3600  # the scrip master changes at most daily
 
 
 # =============================================================================
@@ -129,16 +141,85 @@ class DhanClient:
             return {"status": "error", "remarks": str(e)}
 
     def get_instrument_master(self):
-        import httpx
+        # Fresh-enough Parquet cache: skips the multi-MB download and the
+        # low_memory CSV parse entirely on reruns within the TTL
+        if MASTER_CACHE.exists() and time.time() - MASTER_CACHE.stat().st_mtime < MASTER_CACHE_TTL:
+            df = pd.read_parquet(MASTER_CACHE)
+            print(f"  [OK] {len(df):,} instruments loaded (cached)")
+            return _drop_expired(df)
+
         print("  Downloading instrument master CSV...")
-        resp = httpx.get(
+        resp = get_client().get(
             "https://images.dhan.co/api-data/api-scrip-master.csv",
-            timeout=120, follow_redirects=True,
+            timeout=120,
         )
         resp.raise_for_status()
         df = pd.read_csv(StringIO(resp.text), low_memory=False)
+
+        # Parse expiries to datetime64 once here; cached reloads get the
+        # typed column straight from Parquet
+        df["SEM_EXPIRY_DATE"] = pd.to_datetime(df["SEM_EXPIRY_DATE"], errors="coerce")
+
+        MASTER_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(MASTER_CACHE, index=False, compression="zstd")
         print(f"  [OK] {len(df):,} instruments loaded")
-        return df
+        return _drop_expired(df)
+
+
+# =============================================================================
+# Async Chunk Fetcher
+# =============================================================================
+# The dhanhq SDK is sync-only, so chunk downloads hit the intraday charts
+# endpoint directly with httpx. A semaphore bounds in-flight requests and a
+# small spacing lock keeps the request rate at the same level the old
+# time.sleep(RATE_LIMIT_SLEEP) loop enforced — but chunks now overlap their
+# network latency instead of paying it serially.
+
+
+class AuthExpiredError(Exception):
+    """Access token rejected — abort instead of burning a rate-limited
+    request (plus its spacing delay) on every remaining chunk."""
+
+
+async def _fetch_chunk(client, sem, spacer, security_id, exchange_segment,
+                       instrument_type, from_date, to_date, interval=1):
+    async with sem:
+        await spacer.wait()
+        try:
+            resp = await client.post(DHAN_INTRADAY_URL, json={
+                "securityId": security_id,
+                "exchangeSegment": exchange_segment,
+                "instrument": instrument_type,
+                "interval": interval,
+                "fromDate": from_date,
+                "toDate": to_date,
+            })
+            resp.raise_for_status()
+            return {"status": "success", "data": resp.json()}
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in (401, 403):
+                raise AuthExpiredError(
+                    f"Dhan rejected the access token (HTTP {e.response.status_code})"
+                ) from e
+            return {"status": "error", "remarks": str(e)}
+        except Exception as e:
+            return {"status": "error", "remarks": str(e)}
+
+
+async def _fetch_all_chunks(chunks, security_id, exchange_segment, instrument_type):
+    sem = asyncio.Semaphore(MAX_CONCURRENT_CHUNKS)
+    spacer = RateSpacer(RATE_LIMIT_SLEEP)
+    headers = {
+        "access-token": DHAN_ACCESS_TOKEN,
+        "client-id": DHAN_CLIENT_ID,
+        "Content-Type": "application/json",
+    }
+    async with httpx.AsyncClient(headers=headers, timeout=60, http2=HTTP2_AVAILABLE) as client:
+        return await asyncio.gather(*[
+            _fetch_chunk(client, sem, spacer, security_id, exchange_segment,
+                         instrument_type, from_date, to_date)
+            for from_date, to_date in chunks
+        ])
 
 
 # =============================================================================
@@ -153,39 +234,37 @@ def parse_response(resp, name=""):
         return pd.DataFrame()
 
     timestamps = data.get("timestamp", data.get("start_Time", []))
-    if not timestamps:
+    n = len(timestamps)
+    if n == 0:
         return pd.DataFrame()
 
-    records = []
-    opens = data.get("open", [])
-    highs = data.get("high", [])
-    lows = data.get("low", [])
-    closes = data.get("close", [])
-    volumes = data.get("volume", [])
-    oi = data.get("open_interest", [])
-
-    for i in range(len(timestamps)):
-        ts = timestamps[i]
-        if isinstance(ts, (int, float)):
-            ts = datetime.fromtimestamp(ts)
-        elif isinstance(ts, str):
-            try:
-                ts = datetime.fromisoformat(ts)
-            except ValueError:
-                ts = datetime.strptime(ts, "%Y-%m-%d %H:%M:%S")
-
-        records.append({
-            "timestamp": ts,
-            "open": float(opens[i]) if i < len(opens) else 0,
-            "high": float(highs[i]) if i < len(highs) else 0,
-            "low": float(lows[i]) if i < len(lows) else 0,
-            "close": float(closes[i]) if i < len(closes) else 0,
-            "volume": int(volumes[i]) if i < len(volumes) else 0,
-            "oi": int(oi[i]) if i < len(oi) else 0,
-        })
-
-    df = pd.DataFrame(records)
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
+    # Columnar construction: one dtype dispatch for the whole timestamp
+    # array instead of isinstance-branching per row, and each OHLCV column
+    # built as a single NumPy array instead of 10k+ per-row dicts
+    ts_arr = np.asarray(timestamps)
+    if np.issubdtype(ts_arr.dtype, np.number):
+        ts = pd.to_datetime(ts_arr, unit="s")
+    else:
+        try:
+            ts = pd.to_datetime(ts_arr, format="ISO8601")
+        except (ValueError, TypeError):
+            ts = pd.to_datetime(ts_arr, format="mixed")
+
+    def _col(key, dtype):
+        arr = np.asarray(data.get(key, []), dtype=dtype)
+        if len(arr) < n:
+            arr = np.pad(arr, (0, n - len(arr)))
+        return arr[:n]
+
+    df = pd.DataFrame({
+        "timestamp": ts,
+        "open": _col("open", np.float64),
+        "high": _col("high", np.float64),
+        "low": _col("low", np.float64),
+        "close": _col("close", np.float64),
+        "volume": _col("volume", np.int64),
+        "oi": _col("open_interest", np.int64),
+    })
     return df.sort_values("timestamp").reset_index(drop=True)
 
 
@@ -193,35 +272,61 @@ def parse_response(resp, name=""):
 # Futures / Options Lookup from Instrument Master
 # =============================================================================
 
-def find_futures(master, symbol, exchange_segment, instrument_type):
-    today = datetime.now().strftime("%Y-%m-%d")
-    mask = (
-        master["SEM_TRADING_SYMBOL"].str.contains(symbol, case=False, na=False)
-        & (master["SEM_INSTRUMENT_NAME"] == instrument_type)
-        & (master["SEM_EXPIRY_DATE"] >= today)
-    )
-    df = master[mask].sort_values("SEM_EXPIRY_DATE")
-    results = []
-    for _, row in df.head(3).iterrows():
-        results.append({
-            "security_id": str(row["SEM_SMST_SECURITY_ID"]),
+def _drop_expired(master):
+    """Keep only contracts expiring today or later.
+
+    Applied once at master-load time so the per-lookup `>= today` string
+    comparison over the whole frame goes away. NaT rows (non-derivative
+    scrips) are dropped too — this master only feeds the FUT/OPT lookups.
+    """
+    return master[master["SEM_EXPIRY_DATE"] >= pd.Timestamp.now().normalize()]
+
+
+# The master has hundreds of thousands of rows; slicing it down to one
+# instrument type and uppercasing the symbols once per type means each
+# subsequent lookup scans thousands of rows instead of the whole file.
+_MASTER_GROUPS = {}
+
+
+def _master_group(master, instrument_type):
+    key = (id(master), instrument_type)
+    grp = _MASTER_GROUPS.get(key)
+    if grp is None:
+        grp = master[master["SEM_INSTRUMENT_NAME"] == instrument_type].copy()
+        grp["symbol_upper"] = grp["SEM_TRADING_SYMBOL"].astype(str).str.upper()
+        _MASTER_GROUPS[key] = grp
+    return grp
+
+
+def _rows_to_results(df, exchange_segment, instrument_type):
+    ids = df["SEM_SMST_SECURITY_ID"].astype(str).to_numpy()
+    names = df["SEM_TRADING_SYMBOL"].astype(str).to_numpy()
+    expiries = df["SEM_EXPIRY_DATE"].dt.strftime("%Y-%m-%d").to_numpy()
+    return [
+        {
+            "security_id": sid,
             "exchange_segment": exchange_segment,
             "instrument_type": instrument_type,
-            "display_name": str(row["SEM_TRADING_SYMBOL"]),
-            "expiry": str(row["SEM_EXPIRY_DATE"]),
-        })
-    return results
+            "display_name": name,
+            "expiry": expiry,
+        }
+        for sid, name, expiry in zip(ids, names, expiries)
+    ]
+
+
+def find_futures(master, symbol, exchange_segment, instrument_type):
+    # Expired contracts were already dropped at master-load time
+    grp = _master_group(master, instrument_type)
+    mask = grp["symbol_upper"].str.contains(symbol.upper(), regex=False, na=False)
+    df = grp[mask].sort_values("SEM_EXPIRY_DATE").head(3)
+    return _rows_to_results(df, exchange_segment, instrument_type)
 
 
 def find_options(master, symbol, exchange_segment, instrument_type,
                  atm_strike, interval, num_strikes):
-    today = datetime.now().strftime("%Y-%m-%d")
-    mask = (
-        master["SEM_TRADING_SYMBOL"].str.contains(symbol, case=False, na=False)
-        & (master["SEM_INSTRUMENT_NAME"] == instrument_type)
-        & (master["SEM_EXPIRY_DATE"] >= today)
-    )
-    df = master[mask].sort_values("SEM_EXPIRY_DATE")
+    grp = _master_group(master, instrument_type)
+    mask = grp["symbol_upper"].str.contains(symbol.upper(), regex=False, na=False)
+    df = grp[mask].sort_values("SEM_EXPIRY_DATE")
     if df.empty:
         return []
 
@@ -229,24 +334,15 @@ def find_options(master, symbol, exchange_segment, instrument_type,
     df = df[df["SEM_EXPIRY_DATE"] == nearest_expiry]
 
     atm = round(atm_strike / interval) * interval
-    targets = [atm + (i - num_strikes // 2) * interval for i in range(num_strikes)]
+    targets = {atm + (i - num_strikes // 2) * interval for i in range(num_strikes)}
 
-    results = []
-    for _, row in df.iterrows():
-        strike = row.get("SEM_STRIKE_PRICE", 0)
-        try:
-            strike = float(strike)
-        except (ValueError, TypeError):
-            continue
-        if strike in targets:
-            results.append({
-                "security_id": str(row["SEM_SMST_SECURITY_ID"]),
-                "exchange_segment": exchange_segment,
-                "instrument_type": instrument_type,
-                "display_name": str(row["SEM_TRADING_SYMBOL"]),
-                "expiry": str(row["SEM_EXPIRY_DATE"]),
-                "strike": strike,
-            })
+    # One vectorized isin mask instead of a float() + `in list` per row
+    strikes = pd.to_numeric(df["SEM_STRIKE_PRICE"], errors="coerce")
+    strike_mask = strikes.isin(targets)
+
+    results = _rows_to_results(df[strike_mask], exchange_segment, instrument_type)
+    for res, strike in zip(results, strikes[strike_mask].to_numpy()):
+        res["strike"] = float(strike)
     return results
 
 
@@ -254,73 +350,124 @@ def find_options(master, symbol, exchange_segment, instrument_type,
 # Core Fetcher — 85-day Chunked Download
 # =============================================================================
 
-def fetch_and_save(client, security_id, exchange_segment, instrument_type,
+def fetch_and_save(security_id, exchange_segment, instrument_type,
                    display_name, days=MAX_HISTORY_DAYS, save_dir=STORAGE_DIR):
     save_dir.mkdir(parents=True, exist_ok=True)
     safe_name = display_name.replace(" ", "_").replace("/", "_").replace("-", "_")
-    filepath = save_dir / f"{safe_name}_1min.csv"
+    filepath = save_dir / f"{safe_name}_1min.parquet"
 
     to_dt = datetime.now()
     from_dt = to_dt - timedelta(days=days)
 
-    all_dfs = []
+    # Build every chunk window up front, then fire them concurrently
+    chunks = []
     chunk_start = from_dt
-    total_chunks = (days // CHUNK_DAYS) + 1
-    chunk_num = 0
-
-    print(f"\n  >> {display_name} [{security_id}] @ {exchange_segment} ({instrument_type})")
-    print(f"     {from_dt.strftime('%Y-%m-%d')} to {to_dt.strftime('%Y-%m-%d')} ({total_chunks} chunks)")
-
     while chunk_start < to_dt:
         chunk_end = min(chunk_start + timedelta(days=CHUNK_DAYS), to_dt)
-        chunk_num += 1
+        chunks.append((chunk_start.strftime("%Y-%m-%d"), chunk_end.strftime("%Y-%m-%d")))
+        chunk_start = chunk_end + timedelta(days=1)
 
-        resp = client.fetch_intraday(
-            security_id, exchange_segment, instrument_type,
-            chunk_start.strftime("%Y-%m-%d"),
-            chunk_end.strftime("%Y-%m-%d"),
-            interval=1,
-        )
+    total_chunks = len(chunks)
 
+    print(f"\n  >> {display_name} [{security_id}] @ {exchange_segment} ({instrument_type})")
+    print(f"     {from_dt.strftime('%Y-%m-%d')} to {to_dt.strftime('%Y-%m-%d')} ({total_chunks} chunks)")
+
+    # AuthExpiredError cancels the whole gather, so a dead token costs one
+    # request instead of total_chunks spaced retries
+    responses = asyncio.run(_fetch_all_chunks(
+        chunks, security_id, exchange_segment, instrument_type,
+    ))
+
+    # Parquet: typed + compressed, reads 5-20x faster downstream than CSV
+    # and keeps timestamps as datetime64 (no reparsing on load). Each chunk
+    # is written as its own row group the moment it is parsed, so peak
+    # memory is one chunk, not the whole 5-year history. Chunk windows do
+    # not overlap and arrive oldest-first, so the file stays sorted without
+    # a concat + drop_duplicates pass.
+    writer = None
+    total = 0
+    first = last = None
+    for chunk_num, ((c_from, c_to), resp) in enumerate(zip(chunks, responses), 1):
         df = parse_response(resp, display_name)
+
+        # Seam-only dedupe: chunks are contiguous and internally sorted, so
+        # a duplicate can only be the previous chunk's closing candle echoed
+        # at this chunk's boundary — one comparison against the last written
+        # timestamp replaces a whole-file drop_duplicates
+        if last is not None and len(df) > 0:
+            df = df[df["timestamp"] > last]
         n = len(df)
 
         if n > 0:
-            all_dfs.append(df)
-            print(f"     [{chunk_num}/{total_chunks}] "
-                  f"{chunk_start.strftime('%Y-%m-%d')} -> {chunk_end.strftime('%Y-%m-%d')}: "
-                  f"{n:,} candles")
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(filepath, table.schema, compression="zstd")
+            writer.write_table(table)
+            total += n
+            if first is None:
+                first = df["timestamp"].iloc[0]
+            last = df["timestamp"].iloc[-1]
+            print(f"     [{chunk_num}/{total_chunks}] {c_from} -> {c_to}: {n:,} candles")
         else:
             remarks = resp.get("remarks", "") if resp else ""
             if resp and resp.get("status") != "success":
-                print(f"     [{chunk_num}/{total_chunks}] "
-                      f"{chunk_start.strftime('%Y-%m-%d')} -> {chunk_end.strftime('%Y-%m-%d')}: "
-                      f"FAILED ({remarks})")
+                print(f"     [{chunk_num}/{total_chunks}] {c_from} -> {c_to}: FAILED ({remarks})")
             else:
-                print(f"     [{chunk_num}/{total_chunks}] "
-                      f"{chunk_start.strftime('%Y-%m-%d')} -> {chunk_end.strftime('%Y-%m-%d')}: "
-                      f"no data")
+                print(f"     [{chunk_num}/{total_chunks}] {c_from} -> {c_to}: no data")
 
-        chunk_start = chunk_end + timedelta(days=1)
-        time.sleep(RATE_LIMIT_SLEEP)
-
-    if not all_dfs:
+    if writer is None:
         print(f"     [WARN] No data for {display_name}")
         return 0
+    writer.close()
 
-    combined = pd.concat(all_dfs, ignore_index=True)
-    combined = combined.drop_duplicates(subset=["timestamp"]).sort_values("timestamp").reset_index(drop=True)
-    combined.to_csv(filepath, index=False)
-
-    total = len(combined)
     size_mb = filepath.stat().st_size / (1024 * 1024)
-    first = combined["timestamp"].iloc[0]
-    last = combined["timestamp"].iloc[-1]
     print(f"     [SAVED] {filepath.name}: {total:,} candles, {size_mb:.1f} MB")
     print(f"     Range: {first} to {last}")
     return total
 
 
+def fetch_one(task):
+    """Download one instrument end-to-end (worker for the process pool).
+
+    Takes a plain tuple so nothing non-picklable crosses the process
+    boundary; each worker spins up its own event loop and httpx client
+    inside fetch_and_save.
+    """
+    security_id, exchange_segment, instrument_type, display_name, days = task
+    return fetch_and_save(security_id, exchange_segment, instrument_type,
+                          display_name, days)
+
+
+def run_fetch_tasks(tasks):
+    """Run instrument downloads across all cores; returns total candles."""
+    if not tasks:
+        return 0
+    if len(tasks) == 1:
+        return fetch_one(tasks[0])
+
+    total = 0
+    n_workers = min(len(tasks), os.cpu_count() or 4)
+    with ProcessPoolExecutor(max_workers=n_workers) as ex:
+        futures = {ex.submit(fetch_one, t): t[3] for t in tasks}
+        done = 0
+        for fut in as_completed(futures):
+            name = futures[fut]
+            done += 1
+            try:
+                n = fut.result()
+            except AuthExpiredError as e:
+                print(f"  [ABORT] {e} — fix DHAN_ACCESS_TOKEN in .env")
+                for other in futures:
+                    other.cancel()
+                raise
+            except Exception as e:
+                print(f"  [WARN] {name} failed: {e}")
+                continue
+            total += n
+            print(f"  [{done}/{len(tasks)}] {name}: {n:,} candles")
+    return total
+
+
 # =============================================================================
 # Main
 # =============================================================================
@@ -339,6 +486,10 @@ def main():
     print("=" * 70)
     print("ANTIGRAVITY TRADING - DHAN DATA FETCHER")
     print("=" * 70)
+    if not DHAN_CLIENT_ID or not DHAN_ACCESS_TOKEN:
+        print("ERROR: DHAN_CLIENT_ID / DHAN_ACCESS_TOKEN not found in .env file")
+        sys.exit(1)
+
     print(f"  Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S IST')}")
     print(f"  History: {args.days} days")
     if args.instrument:
@@ -346,17 +497,15 @@ def main():
     print()
 
     client = DhanClient()
-    grand_total = 0
+    tasks = []
     master = None
 
     # Download instrument master for FUT/OPT lookup
     if not (args.skip_futures and args.skip_options) and not args.skip_master:
         try:
+            # get_instrument_master persists its own Parquet cache, so the
+            # old side-car CSV copy is no longer written
             master = client.get_instrument_master()
-            master_path = STORAGE_DIR / "dhan_instrument_master.csv"
-            master_path.parent.mkdir(parents=True, exist_ok=True)
-            master.to_csv(master_path, index=False)
-            print(f"  Master saved: {master_path.name}")
         except Exception as e:
             print(f"  [WARN] Master download failed: {e}")
 
@@ -369,10 +518,10 @@ def main():
     for key, inst in SPOT_INSTRUMENTS.items():
         if filt and filt not in key:
             continue
-        grand_total += fetch_and_save(
-            client, inst["security_id"], inst["exchange_segment"],
+        tasks.append((
+            inst["security_id"], inst["exchange_segment"],
             inst["instrument_type"], inst["display_name"], args.days,
-        )
+        ))
 
     # ---- FUTURES ----
     if not args.skip_futures and master is not None:
@@ -392,11 +541,11 @@ def main():
                 continue
 
             for fut in futures[:2]:
-                grand_total += fetch_and_save(
-                    client, fut["security_id"], fut["exchange_segment"],
+                tasks.append((
+                    fut["security_id"], fut["exchange_segment"],
                     fut["instrument_type"], fut["display_name"],
                     min(args.days, 90),
-                )
+                ))
 
     # ---- OPTIONS ----
     if not args.skip_options and master is not None:
@@ -417,11 +566,19 @@ def main():
 
             print(f"  Found {len(options)} contracts")
             for opt in options:
-                grand_total += fetch_and_save(
-                    client, opt["security_id"], opt["exchange_segment"],
+                tasks.append((
+                    opt["security_id"], opt["exchange_segment"],
                     opt["instrument_type"], opt["display_name"],
                     min(args.days, 60),
-                )
+                ))
+
+    # ---- DOWNLOAD ----
+    # Every instrument is independent, so spread them across all cores;
+    # each worker process runs its own async chunk fetcher.
+    print("\n" + "-" * 70)
+    print(f"DOWNLOADING {len(tasks)} INSTRUMENTS")
+    print("-" * 70)
+    grand_total = run_fetch_tasks(tasks)
 
     # ---- SUMMARY ----
     print("\n" + "=" * 70)
@@ -430,19 +587,21 @@ def main():
     print(f"  Total candles: {grand_total:,}")
     print(f"  Storage: {STORAGE_DIR}")
 
-    csv_files = sorted(STORAGE_DIR.glob("*_1min.csv"))
-    if csv_files:
+    data_files = sorted(STORAGE_DIR.glob("*_1min.parquet"))
+    if data_files:
         print(f"\n  Files:")
         total_size = 0
-        for f in csv_files:
+        for f in data_files:
             size = f.stat().st_size
             total_size += size
-            # Read first/last line for date range
+            # Date range from Parquet row-group statistics — O(1) metadata
+            # footer read instead of decoding the whole timestamp column
             try:
-                df_peek = pd.read_csv(f, usecols=["timestamp"], nrows=1)
-                first = df_peek["timestamp"].iloc[0]
-                df_tail = pd.read_csv(f, usecols=["timestamp"])
-                last = df_tail["timestamp"].iloc[-1]
+                pf = pq.ParquetFile(f)
+                ci = pf.schema_arrow.names.index("timestamp")
+                md = pf.metadata
+                first = str(md.row_group(0).column(ci).statistics.min)
+                last = str(md.row_group(md.num_row_groups - 1).column(ci).statistics.max)
                 print(f"    {f.name:<45s} {size/1024:>8,.0f} KB  [{first[:10]}..{last[:10]}]")
             except Exception:
                 print(f"    {f.name:<45s} {size/1024:>8,.0f} KB")
@@ -18,18 +18,45 @@ Usage:
 """
 
 import sys
-import time
-import json
+import asyncio
 import argparse
-from datetime import datetime, timedelta
+import gzip
+import hashlib
+import json
+import os
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
 import httpx
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from _http import HTTP2_AVAILABLE, RateSpacer
+
+# orjson decodes the multi-megabyte rolling-option responses several times
+# faster than stdlib json; fall back gracefully when absent.
+try:
+    import orjson
+
+    def _loads(raw: bytes) -> dict:
+        return orjson.loads(raw)
+
+    def _dumps(obj, sort_keys: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+except ImportError:
+    orjson = None
+
+    def _loads(raw: bytes) -> dict:
+        return json.loads(raw)
+
+    def _dumps(obj, sort_keys: bool = False) -> bytes:
+        return json.dumps(obj, sort_keys=sort_keys).encode()
+
 # =============================================================================
 # Config
 # =============================================================================
@@ -46,7 +73,13 @@ DHAN_ACCESS_TOKEN = (
 API_URL = "https://api.dhan.co/v2/charts/rollingoption"
 STORAGE_DIR = PROJECT_ROOT / "storage" / "candles" / "options_historical"
 CHUNK_DAYS = 28  # max 30, use 28 for safety
-RATE_LIMIT = 0.5  # seconds between calls
+RATE_LIMIT = 0.5  # seconds between request starts
+MAX_CONCURRENT = 8  # in-flight requests, well under Dhan's per-host limit
+
+# Historical chunks never change, so their raw responses are memoized on
+# disk — incremental reruns skip both the request and its rate-limit slot
+CACHE_DIR = STORAGE_DIR / ".cache"
+CACHE_MAX_BYTES = 1 * 1024 ** 3  # evict least-recently-used beyond 1 GiB
 
 # Instruments
 INSTRUMENTS = {
@@ -68,7 +101,10 @@ REQUIRED_DATA = ["open", "high", "low", "close", "iv", "volume", "oi", "strike",
 # API Call
 # =============================================================================
 
-def fetch_rolling_options(
+async def fetch_rolling_options(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    spacer: RateSpacer,
     security_id: int,
     exchange_segment: str,
     instrument: str,
@@ -95,20 +131,46 @@ def fetch_rolling_options(
         "toDate": to_date,
     }
 
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "access-token": DHAN_ACCESS_TOKEN,
-    }
-
-    try:
-        resp = httpx.post(API_URL, json=payload, headers=headers, timeout=30)
-        if resp.status_code == 200:
-            return resp.json()
-        else:
-            return {"error": f"HTTP {resp.status_code}", "body": resp.text[:200]}
-    except Exception as e:
-        return {"error": str(e)}
+    # Chunks ending before yesterday are immutable: serve them from disk
+    cache_path = None
+    if datetime.strptime(to_date, "%Y-%m-%d").date() < date.today() - timedelta(days=1):
+        key = hashlib.blake2b(_dumps(payload, sort_keys=True)).hexdigest()
+        cache_path = CACHE_DIR / f"{key}.json.gz"
+        if cache_path.exists():
+            try:
+                cached = _loads(gzip.decompress(cache_path.read_bytes()))
+                os.utime(cache_path)  # LRU touch
+                return cached
+            except Exception:
+                pass  # corrupt entry — refetch and overwrite
+
+    async with sem:
+        await spacer.wait()
+        try:
+            resp = await client.post(API_URL, json=payload)
+            if resp.status_code == 200:
+                result = _loads(resp.content)
+            else:
+                return {"error": f"HTTP {resp.status_code}", "body": resp.text[:200]}
+        except Exception as e:
+            return {"error": str(e)}
+
+    if cache_path is not None:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_suffix(".tmp")
+        tmp.write_bytes(gzip.compress(_dumps(result), compresslevel=3))
+        os.replace(tmp, cache_path)
+    return result
+
+
+def evict_cache(max_bytes: int = CACHE_MAX_BYTES) -> None:
+    """Drop least-recently-used cache entries beyond the size budget."""
+    entries = sorted(CACHE_DIR.glob("*.json.gz"), key=lambda p: p.stat().st_mtime)
+    total = sum(p.stat().st_size for p in entries)
+    while total > max_bytes and entries:
+        oldest = entries.pop(0)
+        total -= oldest.stat().st_size
+        oldest.unlink()
 
 
 # =============================================================================
@@ -131,40 +193,42 @@ def parse_rolling_response(resp: dict, option_type: str) -> pd.DataFrame:
         return pd.DataFrame()
 
     timestamps = side_data.get("timestamp", [])
-    if not timestamps:
+    n = len(timestamps)
+    if n == 0:
         return pd.DataFrame()
 
-    records = []
-    opens = side_data.get("open", [])
-    highs = side_data.get("high", [])
-    lows = side_data.get("low", [])
-    closes = side_data.get("close", [])
-    volumes = side_data.get("volume", [])
-    ivs = side_data.get("iv", [])
-    ois = side_data.get("oi", [])
-    strikes = side_data.get("strike", [])
-    spots = side_data.get("spot", [])
-
-    for i in range(len(timestamps)):
-        ts = timestamps[i]
-        if isinstance(ts, (int, float)):
-            ts = datetime.fromtimestamp(ts)
-
-        records.append({
-            "timestamp": ts,
-            "open": float(opens[i]) if i < len(opens) else 0,
-            "high": float(highs[i]) if i < len(highs) else 0,
-            "low": float(lows[i]) if i < len(lows) else 0,
-            "close": float(closes[i]) if i < len(closes) else 0,
-            "volume": int(volumes[i]) if i < len(volumes) else 0,
-            "iv": float(ivs[i]) if i < len(ivs) else 0,
-            "oi": int(ois[i]) if i < len(ois) else 0,
-            "strike": float(strikes[i]) if i < len(strikes) else 0,
-            "spot": float(spots[i]) if i < len(spots) else 0,
-        })
-
-    df = pd.DataFrame(records)
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
+    # Columnar construction: the response is already column-major, so each
+    # field becomes one NumPy cast (zero-padded to the timestamp length)
+    # instead of ~n dict allocations and per-value float()/int() calls.
+    # float32/int32 halve the memory of a 500k-row strike frame; option
+    # prices and IVs are well within float32 precision.
+    def _col(key, dtype):
+        arr = np.asarray(side_data.get(key, []), dtype=dtype)
+        if len(arr) < n:
+            arr = np.pad(arr, (0, n - len(arr)))
+        return arr[:n]
+
+    ts_arr = np.asarray(timestamps)
+    if np.issubdtype(ts_arr.dtype, np.number):
+        ts = pd.to_datetime(ts_arr, unit="s")
+    else:
+        try:
+            ts = pd.to_datetime(ts_arr, format="ISO8601")
+        except ValueError:
+            ts = pd.to_datetime(ts_arr, format="mixed")
+
+    df = pd.DataFrame({
+        "timestamp": ts,
+        "open": _col("open", np.float32),
+        "high": _col("high", np.float32),
+        "low": _col("low", np.float32),
+        "close": _col("close", np.float32),
+        "volume": _col("volume", np.int32),
+        "iv": _col("iv", np.float32),
+        "oi": _col("oi", np.int32),
+        "strike": _col("strike", np.float32),
+        "spot": _col("spot", np.float32),
+    })
     return df.sort_values("timestamp").reset_index(drop=True)
 
 
@@ -172,7 +236,24 @@ def parse_rolling_response(resp: dict, option_type: str) -> pd.DataFrame:
 # Fetch a single strike/type combo across date range
 # =============================================================================
 
-def fetch_strike_history(
+def _existing_tail(filepath: Path):
+    """Last timestamp already on disk, or None if unreadable/empty."""
+    try:
+        tbl = pacsv.read_csv(
+            filepath,
+            convert_options=pacsv.ConvertOptions(include_columns=["timestamp"]),
+        )
+    except Exception:
+        return None
+    if tbl.num_rows == 0:
+        return None
+    return pd.Timestamp(tbl["timestamp"][-1].as_py())
+
+
+async def fetch_strike_history(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    spacer: RateSpacer,
     instrument_name: str,
     config: dict,
     expiry_flag: str,
@@ -181,18 +262,41 @@ def fetch_strike_history(
     option_type: str,
     from_date: datetime,
     to_date: datetime,
-) -> pd.DataFrame:
-    """Fetch full history for one strike/type in 28-day chunks."""
-    all_dfs = []
-    chunk_start = from_date
-    total_chunks = ((to_date - from_date).days // CHUNK_DAYS) + 1
-    chunk_num = 0
+    filepath: Path,
+    meta: dict,
+) -> tuple:
+    """Fetch full history for one strike/type in 28-day chunks.
+
+    All chunks go out concurrently (bounded by the shared semaphore and
+    rate spacer), then each parsed chunk streams straight into the CSV
+    and is discarded — no all_dfs accumulation, no final
+    concat/dedupe/sort. Chunks arrive oldest-first and internally
+    sorted, so only the seam against the last written timestamp needs a
+    duplicate check. Returns (total, first_ts, last_ts).
+
+    Re-runs resume from the day after the last timestamp already on
+    disk and append, so a daily refresh fetches one chunk instead of
+    the full history.
+    """
+    resume_from = (
+        await asyncio.to_thread(_existing_tail, filepath) if filepath.exists() else None
+    )
+    if resume_from is not None:
+        next_day = datetime.combine(
+            resume_from.date() + timedelta(days=1), datetime.min.time()
+        )
+        from_date = max(from_date, next_day)
 
+    chunks = []
+    chunk_start = from_date
     while chunk_start < to_date:
         chunk_end = min(chunk_start + timedelta(days=CHUNK_DAYS), to_date)
-        chunk_num += 1
+        chunks.append((chunk_start, chunk_end))
+        chunk_start = chunk_end + timedelta(days=1)
 
-        resp = fetch_rolling_options(
+    responses = await asyncio.gather(*[
+        fetch_rolling_options(
+            client, sem, spacer,
             security_id=config["security_id"],
             exchange_segment=config["exchange_segment"],
             instrument=config["instrument"],
@@ -200,29 +304,95 @@ def fetch_strike_history(
             expiry_code=expiry_code,
             strike=strike,
             option_type=option_type,
-            from_date=chunk_start.strftime("%Y-%m-%d"),
-            to_date=chunk_end.strftime("%Y-%m-%d"),
+            from_date=s.strftime("%Y-%m-%d"),
+            to_date=e.strftime("%Y-%m-%d"),
         )
-
+        for s, e in chunks
+    ])
+
+    writer = None
+    sink = None
+    total = 0
+    first = None
+    last = resume_from
+    for resp in responses:
         df = parse_rolling_response(resp, option_type)
-        n = len(df)
-
-        if n > 0:
-            all_dfs.append(df)
-
-        if chunk_num % 10 == 0 or chunk_num == total_chunks:
-            total_so_far = sum(len(d) for d in all_dfs)
-            print(f"       chunk {chunk_num}/{total_chunks}: {total_so_far:,} candles so far")
-
-        chunk_start = chunk_end + timedelta(days=1)
-        time.sleep(RATE_LIMIT)
-
-    if not all_dfs:
-        return pd.DataFrame()
-
-    combined = pd.concat(all_dfs, ignore_index=True)
-    combined = combined.drop_duplicates(subset=["timestamp"]).sort_values("timestamp").reset_index(drop=True)
-    return combined
+        if last is not None and len(df) > 0:
+            df = df[df["timestamp"] > last]
+        if len(df) == 0:
+            continue
+
+        for col, value in meta.items():
+            df[col] = value
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if writer is None:
+            if resume_from is not None:
+                sink = filepath.open("ab")
+                writer = pacsv.CSVWriter(
+                    sink, table.schema,
+                    write_options=pacsv.WriteOptions(include_header=False),
+                )
+            else:
+                writer = pacsv.CSVWriter(filepath, table.schema)
+        # CSV formatting releases the GIL inside Arrow; pushing it to a
+        # thread keeps the event loop free to service other strikes'
+        # requests while this one writes.
+        await asyncio.to_thread(writer.write_table, table)
+
+        total += len(df)
+        if first is None:
+            first = df["timestamp"].iloc[0]
+        last = df["timestamp"].iloc[-1]
+
+    if writer is not None:
+        writer.close()
+    if sink is not None:
+        sink.close()
+    return total, first, last
+
+
+async def fetch_instrument(
+    inst_name: str,
+    config: dict,
+    strikes: list,
+    expiry_flag: str,
+    from_date: datetime,
+    to_date: datetime,
+) -> list:
+    """Fetch every (strike, option type) pair for one instrument.
+
+    One AsyncClient / semaphore / spacer is shared across all pairs, so
+    chunks from different strikes overlap on the wire while the overall
+    request rate stays at RATE_LIMIT.
+    """
+    pairs = [(s, ot) for s in strikes for ot in ("CALL", "PUT")]
+    sem = asyncio.Semaphore(MAX_CONCURRENT)
+    spacer = RateSpacer(RATE_LIMIT)
+    headers = {
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+        "access-token": DHAN_ACCESS_TOKEN,
+    }
+    limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+    async with httpx.AsyncClient(
+        headers=headers, timeout=30, limits=limits, http2=HTTP2_AVAILABLE,
+    ) as client:
+        stats = await asyncio.gather(*[
+            fetch_strike_history(
+                client, sem, spacer, inst_name, config,
+                expiry_flag, 1, strike, opt_type, from_date, to_date,
+                filepath=STORAGE_DIR / f"{inst_name}_{strike}_{opt_type[0]}E_{expiry_flag}_1min.csv",
+                meta={
+                    "instrument": inst_name,
+                    "strike_label": strike,
+                    "option_type": opt_type[0] + "E",
+                    "expiry_type": expiry_flag,
+                },
+            )
+            for strike, opt_type in pairs
+        ])
+    return list(zip(pairs, stats))
 
 
 # =============================================================================
@@ -277,36 +447,31 @@ def main():
         print(f"\n{'='*70}")
         print(f"  {inst_name} OPTIONS ({args.expiry} expiry)")
         print(f"{'='*70}")
+        print(f"  Fetching {len(strikes_to_fetch) * 2} strike/type pairs concurrently...")
 
-        for strike in strikes_to_fetch:
-            for opt_type in ["CALL", "PUT"]:
-                label = f"{inst_name}_{strike}_{opt_type[0]}E_{args.expiry}"
-                print(f"\n  >> {label}")
+        results = asyncio.run(fetch_instrument(
+            inst_name, config, strikes_to_fetch, args.expiry, from_date, to_date,
+        ))
 
-                df = fetch_strike_history(
-                    inst_name, config, args.expiry, 1,
-                    strike, opt_type, from_date, to_date,
-                )
+        for (strike, opt_type), (total, first, last) in results:
+            label = f"{inst_name}_{strike}_{opt_type[0]}E_{args.expiry}"
+            print(f"\n  >> {label}")
 
-                if df.empty:
+            filepath = STORAGE_DIR / f"{label}_1min.csv"
+            if total == 0:
+                if filepath.exists():
+                    print(f"     [OK] {filepath.name}: already up to date")
+                else:
                     print(f"     [WARN] No data")
-                    continue
-
-                # Add metadata columns
-                df["instrument"] = inst_name
-                df["strike_label"] = strike
-                df["option_type"] = opt_type[0] + "E"
-                df["expiry_type"] = args.expiry
-
-                filepath = STORAGE_DIR / f"{label}_1min.csv"
-                df.to_csv(filepath, index=False)
-
-                size_kb = filepath.stat().st_size / 1024
-                first = df["timestamp"].iloc[0]
-                last = df["timestamp"].iloc[-1]
-                print(f"     [SAVED] {filepath.name}: {len(df):,} candles, {size_kb:.0f} KB")
-                print(f"     Range: {first} to {last}")
-                grand_total += len(df)
+                continue
+
+            size_kb = filepath.stat().st_size / 1024
+            print(f"     [SAVED] {filepath.name}: {total:,} new candles, {size_kb:.0f} KB")
+            print(f"     Range: {first} to {last}")
+            grand_total += total
+
+    if CACHE_DIR.exists():
+        evict_cache()
 
     # Summary
     print(f"\n{'='*70}")
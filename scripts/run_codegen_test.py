@@ -20,14 +20,32 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from dotenv import load_dotenv
 load_dotenv(Path(__file__).parent.parent / ".env")
 
+import os
 from datetime import date, time
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
 from engine.strategy_sdk import StrategyContext, StrategyResult, TradeRecord
 from engine.cost_model import CostModel, CostConfig
 from engine.options_backtester import _data_loader, load_expiry_calendar, get_next_expiry
 from datetime import timedelta
 
 
+def _minute_open_prices(candles) -> np.ndarray:
+    """Leg open prices as a flat array indexed by minutes-since-midnight.
+
+    0.0 marks minutes with no candle, matching what get_option_price_at
+    returns for them; the first candle of each minute wins.
+    """
+    prices = np.zeros(24 * 60)
+    if not candles.empty:
+        ts = candles["timestamp"]
+        mins = (ts.dt.hour * 60 + ts.dt.minute).to_numpy()
+        prices[mins[::-1]] = candles["open"].to_numpy(np.float64)[::-1]
+    return prices
+
+
 def strategy(ctx: StrategyContext):
     """ATM Straddle + Re-entry on SL hit."""
     entry_t = time(9, 16)
@@ -48,7 +66,9 @@ def strategy(ctx: StrategyContext):
         ctx.close_all("no_data")
         return
 
-    # Track SL prices and re-entry state
+    # Track SL prices and re-entry state. Position identity is stable in
+    # the context, so these references stay valid for the whole day and
+    # the loop never needs another get_position lookup.
     ce_pos = ctx.get_position(ce_id)
     pe_pos = ctx.get_position(pe_id)
 
@@ -65,6 +85,8 @@ def strategy(ctx: StrategyContext):
     # Re-entry position tracking
     ce2_id = None
     pe2_id = None
+    ce2_pos = None
+    pe2_pos = None
     ce2_sl_price = None
     pe2_sl_price = None
 
@@ -77,17 +99,22 @@ def strategy(ctx: StrategyContext):
         ctx.close_all("no_candle_data")
         return
 
-    for _, row in ce_candles.iterrows():
-        t = row["timestamp"].time()
+    # Only the bar time drives this loop, so pull the timestamp column once
+    # (no per-row Series boxing via iterrows) and bound the hot window with
+    # two searchsorted calls instead of per-bar entry/exit guards. Bars at
+    # or past exit_t fall through to the close_all at the bottom, which
+    # issues the same time_exit the in-loop check did.
+    times = ce_candles["timestamp"].dt.time.to_numpy()
+    start = times.searchsorted(entry_t, side="right")
+    end = times.searchsorted(exit_t, side="left")
 
-        # Skip candles before entry
-        if t <= entry_t:
-            continue
+    # Hoist the ATM re-entry price lookups out of the loop: one array read
+    # per bar instead of a strike/type resolution through the context
+    ce_prices = _minute_open_prices(ce_candles)
+    pe_prices = _minute_open_prices(ctx.get_candles("ATM", "PE"))
 
-        # Time exit
-        if t >= exit_t:
-            ctx.close_all("time_exit", at_time=f"{exit_t.hour:02d}:{exit_t.minute:02d}")
-            return
+    for t in times[start:end]:
+        tmin = t.hour * 60 + t.minute
 
         # Update all position prices
         ctx.update_prices(t)
@@ -111,8 +138,7 @@ def strategy(ctx: StrategyContext):
 
         # --- Check SL on initial CE leg ---
         if not ce_sl_hit:
-            ce_p = ctx.get_position(ce_id)
-            if ce_p and ce_p.is_open and ce_p.current_price >= ce_sl_price:
+            if ce_pos.is_open and ce_pos.current_price >= ce_sl_price:
                 ctx.close_position(ce_id, price=ce_sl_price, reason="sl_hit",
                                    at_time=f"{t.hour:02d}:{t.minute:02d}")
                 ce_sl_hit = True
@@ -121,8 +147,7 @@ def strategy(ctx: StrategyContext):
 
         # --- Check SL on initial PE leg ---
         if not pe_sl_hit:
-            pe_p = ctx.get_position(pe_id)
-            if pe_p and pe_p.is_open and pe_p.current_price >= pe_sl_price:
+            if pe_pos.is_open and pe_pos.current_price >= pe_sl_price:
                 ctx.close_position(pe_id, price=pe_sl_price, reason="sl_hit",
                                    at_time=f"{t.hour:02d}:{t.minute:02d}")
                 pe_sl_hit = True
@@ -131,44 +156,46 @@ def strategy(ctx: StrategyContext):
 
         # --- CE Re-entry: only when ATM CE price increased 10% from SL exit ---
         if ce_sl_hit and not ce_reentry_done:
-            current_ce_price = ctx.get_option_price_at("ATM", "CE", t)
+            current_ce_price = ce_prices[tmin]
             if current_ce_price > 0 and current_ce_price >= ce_sl_exit_price * (1 + reentry_price_increase):
                 ce2_id = ctx.open_position("ATM", "CE", "SELL", 1, "CE leg 2 (re-entry)",
                                            price=current_ce_price,
                                            at_time=t)
                 if ce2_id != -1:
+                    ce2_pos = ctx.get_position(ce2_id)
                     ce2_sl_price = current_ce_price * (1 + sl_pct / 100)
                     ce_reentry_done = True
                     ctx.log(f"CE re-entry at {t}, price: {current_ce_price:.1f} (10% above SL)")
 
         # --- PE Re-entry: only when ATM PE price increased 10% from SL exit ---
         if pe_sl_hit and not pe_reentry_done:
-            current_pe_price = ctx.get_option_price_at("ATM", "PE", t)
+            current_pe_price = pe_prices[tmin]
             if current_pe_price > 0 and current_pe_price >= pe_sl_exit_price * (1 + reentry_price_increase):
                 pe2_id = ctx.open_position("ATM", "PE", "SELL", 1, "PE leg 2 (re-entry)",
                                            price=current_pe_price,
                                            at_time=t)
                 if pe2_id != -1:
+                    pe2_pos = ctx.get_position(pe2_id)
                     pe2_sl_price = current_pe_price * (1 + sl_pct / 100)
                     pe_reentry_done = True
                     ctx.log(f"PE re-entry at {t}, price: {current_pe_price:.1f} (10% above SL)")
 
         # --- Check SL on CE re-entry leg ---
-        if ce2_id and ce2_sl_price:
-            ce2_p = ctx.get_position(ce2_id)
-            if ce2_p and ce2_p.is_open and ce2_p.current_price >= ce2_sl_price:
+        if ce2_pos is not None and ce2_sl_price:
+            if ce2_pos.is_open and ce2_pos.current_price >= ce2_sl_price:
                 ctx.close_position(ce2_id, price=ce2_sl_price, reason="reentry_sl",
                                    at_time=f"{t.hour:02d}:{t.minute:02d}")
                 ctx.log(f"CE re-entry SL hit at {t}")
+                ce2_pos = None
                 ce2_id = None
 
         # --- Check SL on PE re-entry leg ---
-        if pe2_id and pe2_sl_price:
-            pe2_p = ctx.get_position(pe2_id)
-            if pe2_p and pe2_p.is_open and pe2_p.current_price >= pe2_sl_price:
+        if pe2_pos is not None and pe2_sl_price:
+            if pe2_pos.is_open and pe2_pos.current_price >= pe2_sl_price:
                 ctx.close_position(pe2_id, price=pe2_sl_price, reason="reentry_sl",
                                    at_time=f"{t.hour:02d}:{t.minute:02d}")
                 ctx.log(f"PE re-entry SL hit at {t}")
+                pe2_pos = None
                 pe2_id = None
 
     # Close anything remaining at end of day
@@ -179,60 +206,82 @@ def strategy(ctx: StrategyContext):
 # Run the backtest
 # ======================================================================
 
+LOT_SIZE = 65
+
+# Expiry calendar cached per worker process
+_expiry_df = None
+
+
+def run_one_day(current: date):
+    """Run the strategy for one trading day (process-pool worker).
+
+    Top-level so it pickles; each worker keeps its own expiry calendar
+    and data-loader file cache, so a file is read at most once per
+    process. Returns (date, DayResult, error) or None when there is no
+    data for the day.
+    """
+    global _expiry_df
+    if _expiry_df is None:
+        _expiry_df = load_expiry_calendar()
+
+    day_data = _data_loader.load_day(current)
+    if day_data is None or day_data.empty:
+        return None
+
+    next_expiry = get_next_expiry(current, _expiry_df)
+    dte = (next_expiry - current).days if next_expiry else 0
+
+    ctx = StrategyContext(
+        day_data=day_data,
+        trade_date=current,
+        dte=dte,
+        lot_size=LOT_SIZE,
+        cost_model=CostModel(CostConfig(slippage_pts=0.5, brokerage_per_order=20)),
+        entry_time_str="09:16",
+        exit_time_str="14:30",
+    )
+
+    error = None
+    try:
+        strategy(ctx)
+    except Exception as e:
+        error = f"[{current}] {e}"
+
+    return current, ctx._collect_day_result(), error
+
+
 if __name__ == "__main__":
-    cost_model = CostModel(CostConfig(slippage_pts=0.5, brokerage_per_order=20))
-    lot_size = 65
     from_date = date(2024, 1, 1)
     to_date = date(2024, 12, 31)
 
-    _data_loader.preload_range(from_date, to_date)
-    expiry_df = load_expiry_calendar()
-
     result = StrategyResult(
         strategy_name="ATM Straddle + Re-entry on SL",
         generated_code="Hand-written by Antigravity AI",
         user_prompt="Sell straddle, 30% SL, re-entry on 10% price increase, global SL 9000, lock 200@1500",
         from_date=from_date,
         to_date=to_date,
-        lot_size=lot_size,
+        lot_size=LOT_SIZE,
     )
 
-    current = from_date
-    while current <= to_date:
-        if current.weekday() >= 5:
-            current += timedelta(days=1)
-            continue
-
-        day_data = _data_loader.load_day(current)
-        if day_data is None or day_data.empty:
-            current += timedelta(days=1)
-            continue
-
-        next_expiry = get_next_expiry(current, expiry_df)
-        dte = (next_expiry - current).days if next_expiry else 0
-
-        ctx = StrategyContext(
-            day_data=day_data,
-            trade_date=current,
-            dte=dte,
-            lot_size=lot_size,
-            cost_model=cost_model,
-            entry_time_str="09:16",
-            exit_time_str="14:30",
-        )
-
-        try:
-            strategy(ctx)
-        except Exception as e:
-            result.execution_errors.append(f"[{current}] {e}")
-
-        day_result = ctx._collect_day_result()
-        if day_result.trades:
-            result.trades.extend(day_result.trades)
-            result.daily_pnl[current] = day_result.daily_pnl
-        result.logs.extend(day_result.logs)
-
-        current += timedelta(days=1)
+    trading_days = [
+        from_date + timedelta(days=i)
+        for i in range((to_date - from_date).days + 1)
+        if (from_date + timedelta(days=i)).weekday() < 5
+    ]
+
+    # Days are independent, so spread them across all cores; ex.map keeps
+    # chronological order, so aggregation below matches the serial run
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        for out in ex.map(run_one_day, trading_days, chunksize=8):
+            if out is None:
+                continue
+            current, day_result, error = out
+            if error:
+                result.execution_errors.append(error)
+            if day_result.trades:
+                result.trades.extend(day_result.trades)
+                result.daily_pnl[current] = day_result.daily_pnl
+            result.logs.extend(day_result.logs)
 
     # ── Print Results ──
     s = result
@@ -265,14 +314,20 @@ if __name__ == "__main__":
     print(f"  Exec Errors:       {len(s.execution_errors)}")
     print()
 
-    # Monthly breakdown
-    monthly = defaultdict(lambda: {"pnl": 0, "trades": 0, "wins": 0})
-    for t in s.trades:
-        m = t.trade_date.month
-        monthly[m]["pnl"] += t.net_pnl
-        monthly[m]["trades"] += 1
-        if t.net_pnl > 0:
-            monthly[m]["wins"] += 1
+    # Monthly breakdown — one groupby in pandas C instead of a Python
+    # accumulation loop over every trade
+    if s.trades:
+        trades_df = pd.DataFrame({
+            "month": [t.trade_date.month for t in s.trades],
+            "net_pnl": [t.net_pnl for t in s.trades],
+        })
+        agg = trades_df.groupby("month")["net_pnl"].agg(
+            pnl="sum", trades="size", wins=lambda x: int((x > 0).sum()),
+        )
+        monthly = agg.to_dict("index")
+    else:
+        monthly = {}
+    no_trades = {"pnl": 0, "trades": 0, "wins": 0}
 
     months = ["", "Jan", "Feb", "Mar", "Apr", "May", "Jun",
               "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
@@ -280,7 +335,7 @@ if __name__ == "__main__":
     print(f"  {'Mon':>4s}  {'Trades':>7s}  {'WR':>6s}  {'Net PnL':>12s}")
     print("  " + "-" * 35)
     for m in range(1, 13):
-        d = monthly[m]
+        d = monthly.get(m, no_trades)
         wr = (d["wins"] / d["trades"] * 100) if d["trades"] > 0 else 0
         sign = "+" if d["pnl"] >= 0 else ""
         print(f"  {months[m]:>4s}  {d['trades']:7d}  {wr:5.1f}%  {sign}Rs.{d['pnl']:>10,.0f}")
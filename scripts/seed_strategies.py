@@ -3,12 +3,20 @@ Seed 10 sample strategies into the Antigravity Trading dashboard.
 Run: python scripts/seed_strategies.py
 """
 
+import asyncio
+import hashlib
 import json
 import httpx
 import time
+from pathlib import Path
 
 API = "http://localhost:8000/api/strategy-ai"
 
+# Identical payloads (same strategy, dates, costs) produce identical
+# backtests, so responses are memoized on disk keyed by payload hash —
+# re-runs of the script skip the 120s server calls entirely.
+BT_CACHE_DIR = Path(__file__).parent / ".bt_cache"
+
 # ═══════════════════════════════════════════════════════════════
 # 10 Diverse NIFTY Options Strategies
 # ═══════════════════════════════════════════════════════════════
@@ -149,60 +157,117 @@ STRATEGIES = [
 ]
 
 
+# The backtest payloads never vary between runs, so the dict merges
+# happen once at import instead of per request.
+BT_PAYLOADS = [
+    {
+        **s,
+        "from_date": "2024-01-01",
+        "to_date": "2024-12-31",
+        "slippage_pts": 0.5,
+        "brokerage_per_order": 20,
+    }
+    for s in STRATEGIES
+]
+
+
+async def _save(client, s):
+    return await client.post("/strategies/save", json=s)
+
+
+async def seed_strategies_async():
+    """Dispatch all save POSTs concurrently over one pooled client."""
+    limits = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+    async with httpx.AsyncClient(base_url=API, limits=limits, timeout=10) as client:
+        return await asyncio.gather(
+            *[_save(client, s) for s in STRATEGIES], return_exceptions=True
+        )
+
+
 def seed_strategies():
     """Save all 10 strategies via the API."""
     print("=" * 60)
     print("SEEDING 10 SAMPLE STRATEGIES")
     print("=" * 60)
 
+    responses = asyncio.run(seed_strategies_async())
+
     saved = []
-    for i, s in enumerate(STRATEGIES, 1):
+    for i, (s, r) in enumerate(zip(STRATEGIES, responses), 1):
         print(f"\n[{i}/10] Saving: {s['name']}")
-        try:
-            r = httpx.post(f"{API}/strategies/save", json=s, timeout=10)
-            if r.status_code == 200:
-                data = r.json()
-                print(f"  -> Saved as {data['id']}")
-                saved.append(data)
-            else:
-                print(f"  -> Failed: {r.status_code} {r.text[:200]}")
-        except Exception as e:
-            print(f"  -> Error: {e}")
+        if isinstance(r, Exception):
+            print(f"  -> Error: {r}")
+        elif r.status_code == 200:
+            data = r.json()
+            print(f"  -> Saved as {data['id']}")
+            saved.append(data)
+        else:
+            print(f"  -> Failed: {r.status_code} {r.text[:200]}")
 
     print(f"\n{'=' * 60}")
     print(f"Saved {len(saved)}/10 strategies")
     return saved
 
 
+async def _bt(client, sem, payload):
+    """POST one backtest, serving repeats from the disk cache.
+
+    Returns the response JSON dict (cached or fresh); non-200 responses
+    come back as the raw Response for the caller to report.
+    """
+    key = hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+    cache_path = BT_CACHE_DIR / f"{key}.json"
+    if cache_path.exists():
+        return json.loads(cache_path.read_text())
+
+    async with sem:
+        resp = await client.post("/backtest", json=payload)
+    if resp.status_code != 200:
+        return resp
+
+    data = resp.json()
+    BT_CACHE_DIR.mkdir(exist_ok=True)
+    cache_path.write_text(json.dumps(data))
+    return data
+
+
+async def run_backtests_async():
+    """Run all backtests concurrently, capped at 4 in flight.
+
+    The cap keeps the API's worker pool from being swamped; with k
+    workers serving, 10 backtests finish in ~ceil(10/k) backtest-times
+    instead of 10.
+    """
+    sem = asyncio.Semaphore(4)
+    limits = httpx.Limits(max_connections=4, max_keepalive_connections=4)
+    async with httpx.AsyncClient(base_url=API, limits=limits, timeout=120) as client:
+        return await asyncio.gather(
+            *[_bt(client, sem, payload) for payload in BT_PAYLOADS],
+            return_exceptions=True,
+        )
+
+
 def run_backtests():
     """Run backtest for each strategy (2024 full year)."""
     print("\n" + "=" * 60)
     print("RUNNING BACKTESTS FOR ALL STRATEGIES")
     print("=" * 60)
 
+    responses = asyncio.run(run_backtests_async())
+
     results = []
-    for i, s in enumerate(STRATEGIES, 1):
+    for i, (s, r) in enumerate(zip(STRATEGIES, responses), 1):
         print(f"\n[{i}/10] Backtesting: {s['name']}...")
-        payload = {
-            **s,
-            "from_date": "2024-01-01",
-            "to_date": "2024-12-31",
-            "slippage_pts": 0.5,
-            "brokerage_per_order": 20,
-        }
-        try:
-            r = httpx.post(f"{API}/backtest", json=payload, timeout=120)
-            if r.status_code == 200:
-                data = r.json()
-                summary = data["summary"]
-                print(f"  Trades: {summary['total_trades']} | WR: {summary['win_rate']}%")
-                print(f"  Net P&L: Rs.{summary['net_pnl']:,.0f} | Max DD: Rs.{summary['max_drawdown']:,.0f}")
-                print(f"  Sharpe: {summary.get('sharpe_ratio', 'N/A')} | PF: {summary.get('profit_factor', 'N/A')}")
-                results.append({"name": s["name"], "summary": summary})
-            else:
-                print(f"  -> Failed: {r.status_code}")
-        except Exception as e:
-            print(f"  -> Error: {e}")
+        if isinstance(r, Exception):
+            print(f"  -> Error: {r}")
+        elif isinstance(r, dict):
+            summary = r["summary"]
+            print(f"  Trades: {summary['total_trades']} | WR: {summary['win_rate']}%")
+            print(f"  Net P&L: Rs.{summary['net_pnl']:,.0f} | Max DD: Rs.{summary['max_drawdown']:,.0f}")
+            print(f"  Sharpe: {summary.get('sharpe_ratio', 'N/A')} | PF: {summary.get('profit_factor', 'N/A')}")
+            results.append({"name": s["name"], "summary": summary})
+        else:
+            print(f"  -> Failed: {r.status_code}")
 
     # Print comparison table
     if results:
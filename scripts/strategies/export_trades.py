@@ -6,76 +6,125 @@ from dotenv import load_dotenv
 load_dotenv(Path(__file__).parent.parent.parent / ".env")
 
 from scripts.strategies.strat_01_straddle_reentry import run_backtest
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
-from collections import defaultdict
 import json
+import pickle
 
-FROM, TO, LOT = date(2021, 1, 1), date(2026, 2, 18), 65
+import numpy as np
+import pandas as pd
 
-print("Running HARD...")
-h_trades, h_dpnl, h_err, h_time, h_days = run_backtest(FROM, TO, LOT, "hard")
-print(f"HARD: {len(h_trades)} trades, {h_time:.0f}s")
+# orjson serializes large lists of trade dicts several times faster than
+# stdlib json and encodes datetime.date natively; fall back gracefully
+# when absent (default=str covers the date fields there).
+try:
+    import orjson
 
-print("Running CLOSE...")
-c_trades, c_dpnl, c_err, c_time, c_days = run_backtest(FROM, TO, LOT, "close")
-print(f"CLOSE: {len(c_trades)} trades, {c_time:.0f}s")
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    orjson = None
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, default=str).encode()
+
+# run_backtest is a pure function of its four arguments, so its result
+# is memoized on disk — re-exports while iterating on the JSON shape
+# (the common case) deserialize in ~100ms instead of replaying 5 years.
+BT_CACHE_DIR = Path(__file__).parent / ".bt_cache"
+
+
+def run_backtest_cached(from_, to_, lot, exit_mode):
+    path = BT_CACHE_DIR / f"{from_}_{to_}_{lot}_{exit_mode}.pkl"
+    if path.exists():
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    result = run_backtest(from_, to_, lot, exit_mode)
+    BT_CACHE_DIR.mkdir(exist_ok=True)
+    with open(path, "wb") as f:
+        pickle.dump(result, f)
+    return result
 
 
 def build_equity_curve(trades):
-    """Build daily equity curve from trades."""
-    daily = defaultdict(float)
-    for t in trades:
-        daily[t["date"]] += t["gross_pnl"]
-
-    curve = []
-    cumulative = 0
-    peak = 0
-    for d in sorted(daily.keys()):
-        cumulative += daily[d]
-        peak = max(peak, cumulative)
-        dd = peak - cumulative
-        curve.append({
-            "date": str(d),
-            "daily_pnl": round(daily[d], 2),
-            "cumulative": round(cumulative, 2),
-            "drawdown": round(dd, 2),
-        })
-    return curve
-
-
-# Convert dates to strings
-for t in h_trades + c_trades:
-    t["date"] = str(t["date"])
-
-# Build equity curves
-h_equity = build_equity_curve(h_trades)
-c_equity = build_equity_curve(c_trades)
-
-# VIX stats
-h_vix = [t.get("vix", 0) for t in h_trades if t.get("vix", 0) > 0]
-c_vix = [t.get("vix", 0) for t in c_trades if t.get("vix", 0) > 0]
-print(f"\nHARD VIX: {len(h_vix)} trades with VIX, range {min(h_vix):.1f}-{max(h_vix):.1f}" if h_vix else "No VIX data")
-print(f"CLOSE VIX: {len(c_vix)} trades with VIX, range {min(c_vix):.1f}-{max(c_vix):.1f}" if c_vix else "No VIX data")
-
-# Save
-out = {
-    "hard": h_trades,
-    "close": c_trades,
-    "hard_equity": h_equity,
-    "close_equity": c_equity,
-}
-out_path = Path(__file__).parent.parent.parent / "dashboard" / "frontend" / "public" / "strat_01_trades.json"
-with open(out_path, "w") as f:
-    json.dump(out, f)
-print(f"\nSaved to {out_path} ({out_path.stat().st_size // 1024}KB)")
-
-# Print DTE trade counts for hardcoding
-for mode, trades in [("hard", h_trades), ("close", c_trades)]:
-    dte_counts = defaultdict(lambda: defaultdict(int))
-    for t in trades:
-        y = int(t["date"][:4])
-        bucket = str(t["dte"]) if t["dte"] <= 6 else "7+"
-        dte_counts[y][bucket] += 1
-    print(f"\n{mode.upper()} DTE COUNTS:")
-    for y in sorted(dte_counts.keys()):
-        print(f"  {y}: {dict(dte_counts[y])}")
+    """Build daily equity curve from trades.
+
+    One groupby-sum plus cumsum/cummax replaces the per-trade and
+    per-day Python loops — the whole curve is four vectorized passes.
+
+    Returns four parallel arrays rather than a dict per day: no
+    thousands of small dict allocations, and the JSON writes each key
+    once instead of once per row. The frontend zips them back into
+    points at load.
+    """
+    if not trades:
+        return {"dates": [], "daily_pnl": [], "cumulative": [], "drawdown": []}
+    df = pd.DataFrame(trades)[["date", "gross_pnl"]]
+    daily = df.groupby("date", sort=True)["gross_pnl"].sum()
+    cum = daily.cumsum()
+    drawdown = cum.cummax() - cum
+    return {
+        "dates": daily.index.astype(str).tolist(),
+        "daily_pnl": daily.round(2).tolist(),
+        "cumulative": cum.round(2).tolist(),
+        "drawdown": drawdown.round(2).tolist(),
+    }
+
+
+def print_vix_stats(h_trades, c_trades):
+    h_vix = [t.get("vix", 0) for t in h_trades if t.get("vix", 0) > 0]
+    c_vix = [t.get("vix", 0) for t in c_trades if t.get("vix", 0) > 0]
+    print(f"\nHARD VIX: {len(h_vix)} trades with VIX, range {min(h_vix):.1f}-{max(h_vix):.1f}" if h_vix else "No VIX data")
+    print(f"CLOSE VIX: {len(c_vix)} trades with VIX, range {min(c_vix):.1f}-{max(c_vix):.1f}" if c_vix else "No VIX data")
+
+
+def print_dte_counts(h_trades, c_trades):
+    # One crosstab per mode instead of a per-trade nested-defaultdict loop
+    for mode, trades in [("hard", h_trades), ("close", c_trades)]:
+        print(f"\n{mode.upper()} DTE COUNTS:")
+        if not trades:
+            continue
+        df = pd.DataFrame(trades)[["date", "dte"]]
+        years = pd.to_datetime(df["date"]).dt.year
+        buckets = np.where(df["dte"] <= 6, df["dte"].astype(str), "7+")
+        tbl = pd.crosstab(years, buckets)
+        for y, row in tbl.iterrows():
+            print(f"  {y}: {row[row > 0].to_dict()}")
+
+
+def export(from_, to_, lot, out_path, include_equity=True, include_vix=True):
+    """Run both exit-mode backtests and write the frontend JSON.
+
+    The shared core for trade exports: variants (with or without equity
+    curves / VIX stats) toggle the flags instead of copying the script.
+    """
+    # The two modes are independent runs over the same data; two worker
+    # processes bring wall time to max(T_hard, T_close) instead of the sum.
+    print("Running HARD and CLOSE in parallel...")
+    with ProcessPoolExecutor(max_workers=2) as ex:
+        f_hard = ex.submit(run_backtest_cached, from_, to_, lot, "hard")
+        f_close = ex.submit(run_backtest_cached, from_, to_, lot, "close")
+        h_trades, h_dpnl, h_err, h_time, h_days = f_hard.result()
+        c_trades, c_dpnl, c_err, c_time, c_days = f_close.result()
+    print(f"HARD: {len(h_trades)} trades, {h_time:.0f}s")
+    print(f"CLOSE: {len(c_trades)} trades, {c_time:.0f}s")
+
+    out = {"hard": h_trades, "close": c_trades}
+    if include_equity:
+        out["hard_equity"] = build_equity_curve(h_trades)
+        out["close_equity"] = build_equity_curve(c_trades)
+    if include_vix:
+        print_vix_stats(h_trades, c_trades)
+
+    out_path.write_bytes(_dumps(out))
+    print(f"\nSaved to {out_path} ({out_path.stat().st_size // 1024}KB)")
+
+    # Print DTE trade counts for hardcoding
+    print_dte_counts(h_trades, c_trades)
+    return out
+
+
+if __name__ == "__main__":
+    FROM, TO, LOT = date(2021, 1, 1), date(2026, 2, 18), 65
+    out_path = Path(__file__).parent.parent.parent / "dashboard" / "frontend" / "public" / "strat_01_trades.json"
+    export(FROM, TO, LOT, out_path)
@@ -10,6 +10,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 from dotenv import load_dotenv
 load_dotenv(Path(__file__).parent.parent.parent / ".env")
 
+from bisect import bisect_left, bisect_right
 from datetime import date, time, timedelta
 from collections import defaultdict
 import time as timer
@@ -28,6 +29,10 @@ def run_day(day_data, trade_date, dte, lot_size, exit_mode):
     """
     entry_t = time(9, 16)
     exit_t = time(14, 30)
+    # Format the fixed entry/exit labels once instead of re-interpolating
+    # them at every use site.
+    entry_ts = f"{entry_t.hour:02d}:{entry_t.minute:02d}"
+    exit_ts = f"{exit_t.hour:02d}:{exit_t.minute:02d}"
     sl_pct = 30
     global_sl = -9000
     profit_lock_trigger = 1500
@@ -121,15 +126,14 @@ def run_day(day_data, trade_date, dte, lot_size, exit_mode):
     all_closed = False
 
     # ── Walk through minutes ──
+    # (hour, minute) tuples compare lexicographically, so two bisects
+    # bound the tradeable window up front — no per-bar time() allocation
+    # or entry/exit comparison inside the loop.
     sorted_times = sorted(set(ce_cache.keys()) | set(pe_cache.keys()))
+    first_bar = bisect_right(sorted_times, (entry_t.hour, entry_t.minute))
+    last_bar = bisect_left(sorted_times, (exit_t.hour, exit_t.minute))
 
-    for hm in sorted_times:
-        t = time(hm[0], hm[1])
-        if t <= entry_t:
-            continue
-        if t >= exit_t:
-            break
-
+    for hm in sorted_times[first_bar:last_bar]:
         ts = f"{hm[0]:02d}:{hm[1]:02d}"
 
         # Current prices (close for update_prices equivalent)
@@ -236,13 +240,13 @@ def run_day(day_data, trade_date, dte, lot_size, exit_mode):
     pe_close_price = pe_cache.get(exit_key, {}).get("open", list(pe_cache.values())[-1]["close"] if pe_cache else 0)
 
     if ce_open:
-        ce_exit_price = ce_close_price; ce_exit_time = f"{exit_t.hour:02d}:{exit_t.minute:02d}"
+        ce_exit_price = ce_close_price; ce_exit_time = exit_ts
     if pe_open:
-        pe_exit_price = pe_close_price; pe_exit_time = f"{exit_t.hour:02d}:{exit_t.minute:02d}"
+        pe_exit_price = pe_close_price; pe_exit_time = exit_ts
     if ce2_open:
-        ce2_exit_price = ce_close_price; ce2_exit_time = f"{exit_t.hour:02d}:{exit_t.minute:02d}"
+        ce2_exit_price = ce_close_price; ce2_exit_time = exit_ts
     if pe2_open:
-        pe2_exit_price = pe_close_price; pe2_exit_time = f"{exit_t.hour:02d}:{exit_t.minute:02d}"
+        pe2_exit_price = pe_close_price; pe2_exit_time = exit_ts
 
     # ── Build trade records ──
     def make_trade(label, entry_p, exit_p, e_time, x_time, x_reason, opt_type, abs_s):
@@ -257,7 +261,6 @@ def run_day(day_data, trade_date, dte, lot_size, exit_mode):
         }
 
     result_trades = []
-    entry_ts = f"{entry_t.hour:02d}:{entry_t.minute:02d}"
 
     if ce_exit_price > 0:
         result_trades.append(make_trade("CE leg 1", ce_entry, ce_exit_price, entry_ts, ce_exit_time, ce_exit_reason, "CE", ce_abs))
@@ -266,11 +269,11 @@ def run_day(day_data, trade_date, dte, lot_size, exit_mode):
     if ce2_entry > 0 and (ce2_exit_price > 0 or not ce2_open):
         if ce2_exit_price == 0:
             ce2_exit_price = ce_close_price
-        result_trades.append(make_trade("CE leg 2 (re-entry)", ce2_entry, ce2_exit_price, ce2_entry_time, ce2_exit_time or f"{exit_t.hour:02d}:{exit_t.minute:02d}", ce2_exit_reason, "CE", ce_abs))
+        result_trades.append(make_trade("CE leg 2 (re-entry)", ce2_entry, ce2_exit_price, ce2_entry_time, ce2_exit_time or exit_ts, ce2_exit_reason, "CE", ce_abs))
     if pe2_entry > 0 and (pe2_exit_price > 0 or not pe2_open):
         if pe2_exit_price == 0:
             pe2_exit_price = pe_close_price
-        result_trades.append(make_trade("PE leg 2 (re-entry)", pe2_entry, pe2_exit_price, pe2_entry_time, pe2_exit_time or f"{exit_t.hour:02d}:{exit_t.minute:02d}", pe2_exit_reason, "PE", pe_abs))
+        result_trades.append(make_trade("PE leg 2 (re-entry)", pe2_entry, pe2_exit_price, pe2_entry_time, pe2_exit_time or exit_ts, pe2_exit_reason, "PE", pe_abs))
 
     daily_pnl = sum(t["gross_pnl"] for t in result_trades)
     return result_trades, logs, daily_pnl, day_vix